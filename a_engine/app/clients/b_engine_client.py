@@ -6,6 +6,10 @@ import requests
 
 from app.config import Settings
 
+# /generate-posts rejects more than 100 posts per request; smaller chunks also keep each request's
+# timeout (scaled by chunk size) bounded.
+GENERATE_POSTS_CHUNK_SIZE = 20
+
 
 class BEngineClient:
     def __init__(self, settings: Settings):
@@ -29,3 +33,32 @@ class BEngineClient:
                 f"B-engine generate-post failed: status={response.status_code}, body={body}"
             )
         return response.json()
+
+    def generate_posts(self, payloads: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        results: list[dict[str, Any]] = []
+        for start in range(0, len(payloads), GENERATE_POSTS_CHUNK_SIZE):
+            chunk = payloads[start : start + GENERATE_POSTS_CHUNK_SIZE]
+            try:
+                results.extend(self._generate_posts_chunk(chunk))
+            except Exception as exc:
+                # Earlier chunks already created posts; report this chunk per post instead of losing them.
+                results.extend({"post_id": None, "status": "failed", "error": str(exc)} for _ in chunk)
+        return results
+
+    def _generate_posts_chunk(self, payloads: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        headers = {"Content-Type": "application/json"}
+        if self.settings.b_engine_admin_token:
+            headers["x-admin-token"] = self.settings.b_engine_admin_token
+
+        response = requests.post(
+            f"{self.base_url}/generate-posts",
+            json={"posts": payloads},
+            headers=headers,
+            timeout=max(45, 45 * len(payloads)),
+        )
+        if response.status_code >= 400:
+            body = response.text[:1000]
+            raise RuntimeError(
+                f"B-engine generate-posts failed: status={response.status_code}, body={body}"
+            )
+        return list(response.json().get("posts", []))
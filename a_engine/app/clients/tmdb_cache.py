@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+# Expired entries are kept this long so they can still be revalidated with a conditional request.
+STALE_RETENTION_SECONDS = 30 * 24 * 3600
+
+
+@dataclass
+class CachedResponse:
+    key: str
+    body: dict[str, Any]
+    etag: str
+    last_modified: str
+    expires_at: float
+
+    @property
+    def fresh(self) -> bool:
+        return self.expires_at > time.time()
+
+
+class TMDBResponseCache:
+    """SQLite-backed cache of TMDB JSON responses keyed by path + query params (never the api_key)."""
+
+    def __init__(self, db_path: Path):
+        self.db_path = db_path
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._local = threading.local()
+        self._stats_lock = threading.Lock()
+        self._stats = {"hits": 0, "revalidated": 0, "misses": 0}
+        self._init_db()
+
+    def _conn(self) -> sqlite3.Connection:
+        # Kept open for the whole run (per thread) instead of reconnecting on every TMDB call.
+        conn = getattr(self._local, "conn", None)
+        if conn is not None and getattr(self._local, "pid", None) == os.getpid():
+            return conn
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        self._local.conn = conn
+        self._local.pid = os.getpid()
+        return conn
+
+    def _init_db(self) -> None:
+        with self._conn() as conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS tmdb_responses (
+                    key TEXT PRIMARY KEY,
+                    path TEXT NOT NULL,
+                    body TEXT NOT NULL,
+                    etag TEXT NOT NULL DEFAULT '',
+                    last_modified TEXT NOT NULL DEFAULT '',
+                    fetched_at REAL NOT NULL,
+                    expires_at REAL NOT NULL
+                )
+                """
+            )
+            conn.execute("DELETE FROM tmdb_responses WHERE expires_at < ?", (time.time() - STALE_RETENTION_SECONDS,))
+
+    @staticmethod
+    def make_key(path: str, params: dict[str, Any]) -> str:
+        canonical = json.dumps(
+            {k: str(v) for k, v in params.items() if k != "api_key" and v is not None},
+            sort_keys=True,
+            ensure_ascii=False,
+        )
+        return hashlib.sha256(f"{path}?{canonical}".encode("utf-8")).hexdigest()
+
+    def lookup(self, key: str) -> CachedResponse | None:
+        with self._conn() as conn:
+            row = conn.execute(
+                "SELECT body, etag, last_modified, expires_at FROM tmdb_responses WHERE key=?",
+                (key,),
+            ).fetchone()
+        if not row:
+            return None
+        try:
+            body = json.loads(row[0])
+        except ValueError:
+            return None
+        return CachedResponse(key=key, body=body, etag=str(row[1] or ""), last_modified=str(row[2] or ""), expires_at=float(row[3]))
+
+    def store(self, key: str, path: str, body: dict[str, Any], etag: str, last_modified: str, ttl_seconds: float) -> None:
+        now = time.time()
+        with self._conn() as conn:
+            conn.execute(
+                """
+                INSERT INTO tmdb_responses (key, path, body, etag, last_modified, fetched_at, expires_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(key) DO UPDATE SET
+                    path=excluded.path, body=excluded.body, etag=excluded.etag, last_modified=excluded.last_modified,
+                    fetched_at=excluded.fetched_at, expires_at=excluded.expires_at
+                """,
+                (key, path, json.dumps(body, ensure_ascii=False), etag or "", last_modified or "", now, now + max(0.0, ttl_seconds)),
+            )
+
+    def refresh(self, key: str, ttl_seconds: float) -> None:
+        # 304 Not Modified: the stored body is still current, only its lifetime is extended.
+        now = time.time()
+        with self._conn() as conn:
+            conn.execute(
+                "UPDATE tmdb_responses SET fetched_at=?, expires_at=? WHERE key=?",
+                (now, now + max(0.0, ttl_seconds), key),
+            )
+
+    def record(self, outcome: str) -> None:
+        with self._stats_lock:
+            self._stats[outcome] = self._stats.get(outcome, 0) + 1
+
+    def stats(self, reset: bool = False) -> dict[str, int]:
+        with self._stats_lock:
+            snapshot = dict(self._stats)
+            if reset:
+                self._stats = {name: 0 for name in self._stats}
+        return snapshot
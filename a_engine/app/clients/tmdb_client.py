@@ -5,8 +5,12 @@ from typing import Any
 
 import requests
 
+from app.clients.tmdb_cache import TMDBResponseCache
 from app.config import Settings
 
+BUNDLE_APPEND = "credits,images,watch/providers"
+IMAGE_LANGUAGES = "ko,en,null"
+
 
 class TMDBClient:
     def __init__(self, settings: Settings):
@@ -14,11 +18,61 @@ class TMDBClient:
         self.base_url = "https://api.themoviedb.org/3"
         self.session = requests.Session()
         self.session.params = {"api_key": settings.tmdb_api_key, "language": settings.tmdb_language}
+        self.cache: TMDBResponseCache | None = None
+        if settings.tmdb_cache_enabled:
+            self.cache = TMDBResponseCache(settings.tmdb_cache_path)
 
     def _get(self, path: str, **params: Any) -> dict[str, Any]:
-        response = self.session.get(f"{self.base_url}{path}", params=params, timeout=20)
+        if self.cache is None:
+            response = self.session.get(f"{self.base_url}{path}", params=params, timeout=20)
+            response.raise_for_status()
+            return response.json()
+
+        # language comes from the session params but changes the response, so it is part of the key.
+        cache_key = TMDBResponseCache.make_key(path, {**params, "language": self.settings.tmdb_language})
+        cached = self.cache.lookup(cache_key)
+        if cached is not None and cached.fresh:
+            self.cache.record("hits")
+            return cached.body
+        headers: dict[str, str] = {}
+        if cached is not None and cached.etag:
+            headers["If-None-Match"] = cached.etag
+        if cached is not None and cached.last_modified:
+            headers["If-Modified-Since"] = cached.last_modified
+
+        response = self.session.get(f"{self.base_url}{path}", params=params, headers=headers, timeout=20)
+        ttl = self._cache_ttl_seconds(path, params)
+        if response.status_code == 304 and cached is not None:
+            self.cache.refresh(cache_key, ttl)
+            self.cache.record("revalidated")
+            return cached.body
         response.raise_for_status()
-        return response.json()
+        data = response.json()
+        self.cache.store(
+            cache_key,
+            path,
+            data,
+            response.headers.get("ETag", ""),
+            response.headers.get("Last-Modified", ""),
+            ttl,
+        )
+        self.cache.record("misses")
+        return data
+
+    def _cache_ttl_seconds(self, path: str, params: dict[str, Any]) -> float:
+        # Availability changes often; titles, credits and artwork rarely do.
+        if "watch/providers" in path or "watch/providers" in str(params.get("append_to_response", "")):
+            hours = self.settings.tmdb_cache_ttl_providers_hours
+        elif path.startswith(("/discover/", "/trending/")):
+            hours = self.settings.tmdb_cache_ttl_lists_hours
+        else:
+            hours = self.settings.tmdb_cache_ttl_details_hours
+        return max(0.0, float(hours)) * 3600
+
+    def cache_stats(self, reset: bool = False) -> dict[str, int]:
+        if self.cache is None:
+            return {}
+        return self.cache.stats(reset=reset)
 
     def fetch_candidates(self, run_mode: str, pages: int = 2, per_page_limit: int = 10) -> list[dict[str, Any]]:
         candidates: list[dict[str, Any]] = []
@@ -49,11 +103,11 @@ class TMDBClient:
         random.shuffle(candidates)
         return candidates
 
-    def fetch_details(self, media_type: str, tmdb_id: int) -> dict[str, Any]:
-        return self._get(f"/{media_type}/{tmdb_id}")
-
-    def fetch_watch_providers(self, media_type: str, tmdb_id: int) -> dict[str, Any]:
-        return self._get(f"/{media_type}/{tmdb_id}/watch/providers")
-
-    def fetch_images(self, media_type: str, tmdb_id: int) -> dict[str, Any]:
-        return self._get(f"/{media_type}/{tmdb_id}/images", include_image_language="ko,en,null")
+    def fetch_bundle(self, media_type: str, tmdb_id: int) -> dict[str, Any]:
+        # Details plus credits, images and watch providers in one round-trip; the appended
+        # parts come back under the "credits", "images" and "watch/providers" keys.
+        return self._get(
+            f"/{media_type}/{tmdb_id}",
+            append_to_response=BUNDLE_APPEND,
+            include_image_language=IMAGE_LANGUAGES,
+        )
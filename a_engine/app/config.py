@@ -40,6 +40,11 @@ class Settings(BaseSettings):
     timezone: str = Field(default="Asia/Seoul", alias="TIMEZONE")
 
     sqlite_path: Path = Field(default=Path("./data/a_engine.db"), alias="SQLITE_PATH")
+    tmdb_cache_enabled: bool = Field(default=True, alias="TMDB_CACHE_ENABLED")
+    tmdb_cache_path: Path = Field(default=Path("./data/tmdb_cache.db"), alias="TMDB_CACHE_PATH")
+    tmdb_cache_ttl_providers_hours: float = Field(default=12, alias="TMDB_CACHE_TTL_PROVIDERS_HOURS")
+    tmdb_cache_ttl_details_hours: float = Field(default=168, alias="TMDB_CACHE_TTL_DETAILS_HOURS")
+    tmdb_cache_ttl_lists_hours: float = Field(default=6, alias="TMDB_CACHE_TTL_LISTS_HOURS")
 
     @property
     def target_provider_set(self) -> set[str]:
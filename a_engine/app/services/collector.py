@@ -30,6 +30,7 @@ class AEngineCollector:
         self.logger = logging.getLogger("a_engine.collector")
 
     def run_once(self) -> RunResult:
+        self.tmdb.cache_stats(reset=True)
         self.logger.info(
             "run started | mode=%s pages=%s collect_limit=%s providers=%s dedup_days=%s",
             self.settings.run_mode,
@@ -50,102 +51,140 @@ class AEngineCollector:
         published = 0
         failed = 0
 
-        for item in candidates:
-            if published >= self.settings.collect_limit:
+        # Submit in batches, topping up from the remaining candidates after each one so a failed
+        # submission is replaced by the next candidate instead of shrinking the run.
+        pending = iter(candidates)
+        while published < self.settings.collect_limit:
+            wanted = self.settings.collect_limit - published
+            ready: list[tuple[int, str, dict[str, Any]]] = []
+            for item in pending:
+                tried += 1
+                outcome, payload = self._check_candidate(item)
+                if outcome == "duplicate":
+                    filtered_duplicate += 1
+                elif outcome == "provider":
+                    filtered_provider += 1
+                elif outcome == "images":
+                    filtered_images += 1
+                else:
+                    ready.append((int(item["id"]), item.get("_media_type", "movie"), payload))
+                    if len(ready) >= wanted:
+                        break
+            if not ready:
                 break
+            batch_published, batch_failed = self._submit_ready(ready)
+            published += batch_published
+            failed += batch_failed
 
-            tried += 1
-            tmdb_id = int(item["id"])
-            media_type = item.get("_media_type", "movie")
-            title_hint = item.get("title") or item.get("name") or ""
+        result = RunResult(
+            tried=tried,
+            filtered_provider=filtered_provider,
+            filtered_duplicate=filtered_duplicate,
+            filtered_images=filtered_images,
+            published=published,
+            failed=failed,
+        )
+        self.logger.info("run finished | result=%s tmdb_cache=%s", result, self.tmdb.cache_stats(reset=True))
+        return result
+
+    def _check_candidate(self, item: dict[str, Any]) -> tuple[str, dict[str, Any]]:
+        tmdb_id = int(item["id"])
+        media_type = item.get("_media_type", "movie")
+        title_hint = item.get("title") or item.get("name") or ""
+        self.logger.info(
+            "candidate checking | tmdb_id=%s media_type=%s source=%s title=%s",
+            tmdb_id,
+            media_type,
+            item.get("_source", "unknown"),
+            title_hint,
+        )
+
+        if self.store.is_recently_posted(tmdb_id, media_type, self.settings.dedup_days):
             self.logger.info(
-                "candidate checking | tmdb_id=%s media_type=%s source=%s title=%s",
+                "candidate skipped (duplicate) | tmdb_id=%s media_type=%s",
                 tmdb_id,
                 media_type,
-                item.get("_source", "unknown"),
-                title_hint,
             )
+            return "duplicate", {}
 
-            if self.store.is_recently_posted(tmdb_id, media_type, self.settings.dedup_days):
-                filtered_duplicate += 1
-                self.logger.info(
-                    "candidate skipped (duplicate) | tmdb_id=%s media_type=%s",
-                    tmdb_id,
-                    media_type,
-                )
-                continue
-
-            if not self._is_available_in_target_provider(media_type, tmdb_id):
-                filtered_provider += 1
-                self.logger.info(
-                    "candidate skipped (provider) | tmdb_id=%s media_type=%s",
-                    tmdb_id,
-                    media_type,
-                )
-                continue
+        # One bundled request per candidate: details + credits + images + watch providers.
+        details = self.tmdb.fetch_bundle(media_type, tmdb_id)
+        if not self._is_available_in_target_provider(details):
+            self.logger.info(
+                "candidate skipped (provider) | tmdb_id=%s media_type=%s",
+                tmdb_id,
+                media_type,
+            )
+            return "provider", {}
 
-            details = self.tmdb.fetch_details(media_type, tmdb_id)
-            images = self._build_images(media_type, tmdb_id, details)
-            still_count = sum(1 for img in images if img.get("type") == "still")
-            if still_count < self.settings.min_stills:
-                filtered_images += 1
-                self.logger.info(
-                    "candidate skipped (images) | tmdb_id=%s media_type=%s still_count=%s min_stills=%s",
-                    tmdb_id,
-                    media_type,
-                    still_count,
-                    self.settings.min_stills,
-                )
-                continue
-            payload = self._build_b_payload(details, images)
+        images = self._build_images(details)
+        still_count = sum(1 for img in images if img.get("type") == "still")
+        if still_count < self.settings.min_stills:
             self.logger.info(
-                "candidate ready | tmdb_id=%s media_type=%s title=%s image_count=%s",
+                "candidate skipped (images) | tmdb_id=%s media_type=%s still_count=%s min_stills=%s",
                 tmdb_id,
                 media_type,
-                payload["prompt_variables"].get("title", ""),
-                len(images),
+                still_count,
+                self.settings.min_stills,
             )
+            return "images", {}
+        payload = self._build_b_payload(details, images)
+        self.logger.info(
+            "candidate ready | tmdb_id=%s media_type=%s title=%s image_count=%s",
+            tmdb_id,
+            media_type,
+            payload["prompt_variables"].get("title", ""),
+            len(images),
+        )
+        return "ready", payload
 
-            try:
-                result = self.b_engine.generate_post(payload)
-                self.store.mark_posted(tmdb_id, media_type)
-                published += 1
-                self.logger.info(
-                    "candidate published | tmdb_id=%s media_type=%s post_id=%s status=%s",
+    def _submit_ready(self, ready: list[tuple[int, str, dict[str, Any]]]) -> tuple[int, int]:
+        published = 0
+        failed = 0
+        # Submit the whole batch in one request instead of one round-trip per candidate.
+        try:
+            results = self.b_engine.generate_posts([payload for _, _, payload in ready])
+        except Exception as exc:
+            results = []
+            for tmdb_id, media_type, _ in ready:
+                failed += 1
+                self.logger.error(
+                    "candidate failed | tmdb_id=%s media_type=%s error=%s",
                     tmdb_id,
                     media_type,
-                    result.get("post_id"),
-                    result.get("status"),
+                    exc,
                 )
-            except Exception as exc:
+
+        for (tmdb_id, media_type, _), submitted in zip(ready, results):
+            if submitted.get("status") == "failed":
                 failed += 1
                 self.logger.error(
-                    "candidate failed | tmdb_id=%s media_type=%s error=%s",
+                    "candidate failed | tmdb_id=%s media_type=%s post_id=%s error=%s",
                     tmdb_id,
                     media_type,
-                    exc,
+                    submitted.get("post_id"),
+                    submitted.get("error", "-"),
                 )
                 continue
+            self.store.mark_posted(tmdb_id, media_type)
+            published += 1
+            self.logger.info(
+                "candidate published | tmdb_id=%s media_type=%s post_id=%s status=%s",
+                tmdb_id,
+                media_type,
+                submitted.get("post_id"),
+                submitted.get("status"),
+            )
+        return published, failed
 
-        result = RunResult(
-            tried=tried,
-            filtered_provider=filtered_provider,
-            filtered_duplicate=filtered_duplicate,
-            filtered_images=filtered_images,
-            published=published,
-            failed=failed,
-        )
-        self.logger.info("run finished | result=%s", result)
-        return result
-
-    def _is_available_in_target_provider(self, media_type: str, tmdb_id: int) -> bool:
-        data = self.tmdb.fetch_watch_providers(media_type, tmdb_id)
+    def _is_available_in_target_provider(self, details: dict[str, Any]) -> bool:
+        data = details.get("watch/providers") or {}
         kr = (data.get("results") or {}).get(self.settings.tmdb_region, {})
         providers = kr.get("flatrate") or []
         names = {str(p.get("provider_name", "")).strip().lower() for p in providers}
         return any(target in names for target in self.settings.target_provider_set)
 
-    def _build_images(self, media_type: str, tmdb_id: int, details: dict[str, Any]) -> list[dict[str, str]]:
+    def _build_images(self, details: dict[str, Any]) -> list[dict[str, str]]:
         images: list[dict[str, str]] = []
         base = self.settings.tmdb_image_base_url.rstrip("/")
 
@@ -153,7 +192,7 @@ class AEngineCollector:
         if poster_path:
             images.append({"url": f"{base}{poster_path}", "type": "poster"})
 
-        image_data = self.tmdb.fetch_images(media_type, tmdb_id)
+        image_data = details.get("images") or {}
         backdrops = image_data.get("backdrops", [])
         still_count = 0
         for backdrop in backdrops:
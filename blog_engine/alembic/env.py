@@ -10,7 +10,7 @@ sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
 
 from app.config import get_settings
 from app.database import Base
-from app.models import image, post  # noqa: F401
+from app.models import image, indexing_job, media_asset, post, post_payload  # noqa: F401
 
 config = context.config
 settings = get_settings()
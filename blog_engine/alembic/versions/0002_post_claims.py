@@ -0,0 +1,25 @@
+"""add worker claim columns to posts
+
+Revision ID: 0002_post_claims
+Revises: 0001_create_tables
+Create Date: 2026-10-18
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0002_post_claims"
+down_revision = "0001_create_tables"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("posts", sa.Column("claimed_by", sa.String(length=64), nullable=True))
+    op.add_column("posts", sa.Column("heartbeat_at", sa.DateTime(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("posts", "heartbeat_at")
+    op.drop_column("posts", "claimed_by")
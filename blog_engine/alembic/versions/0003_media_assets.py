@@ -0,0 +1,31 @@
+"""add media_assets content-hash index
+
+Revision ID: 0003_media_assets
+Revises: 0002_post_claims
+Create Date: 2026-10-18
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0003_media_assets"
+down_revision = "0002_post_claims"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "media_assets",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("content_hash", sa.String(length=64), nullable=False),
+        sa.Column("wp_media_id", sa.Integer(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+    )
+    op.create_unique_constraint("uq_media_assets_content_hash", "media_assets", ["content_hash"])
+
+
+def downgrade() -> None:
+    op.drop_constraint("uq_media_assets_content_hash", "media_assets", type_="unique")
+    op.drop_table("media_assets")
@@ -0,0 +1,29 @@
+"""add resumable publish checkpoint columns
+
+Revision ID: 0004_publish_steps
+Revises: 0003_media_assets
+Create Date: 2026-10-18
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0004_publish_steps"
+down_revision = "0003_media_assets"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("posts", sa.Column("publish_step", sa.String(length=30), nullable=True))
+    op.add_column("posts", sa.Column("wp_category_ids", sa.JSON(), nullable=True))
+    op.add_column("posts", sa.Column("wp_tag_ids", sa.JSON(), nullable=True))
+    op.add_column("images", sa.Column("wp_media_url", sa.String(length=500), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("images", "wp_media_url")
+    op.drop_column("posts", "wp_tag_ids")
+    op.drop_column("posts", "wp_category_ids")
+    op.drop_column("posts", "publish_step")
@@ -0,0 +1,36 @@
+"""add indexing_outbox table
+
+Revision ID: 0005_indexing_outbox
+Revises: 0004_publish_steps
+Create Date: 2026-10-18
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0005_indexing_outbox"
+down_revision = "0004_publish_steps"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "indexing_outbox",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("url", sa.String(length=500), nullable=False),
+        sa.Column("provider", sa.String(length=20), nullable=False),
+        sa.Column("status", sa.String(length=20), nullable=False),
+        sa.Column("attempts", sa.Integer(), nullable=False),
+        sa.Column("next_attempt_at", sa.DateTime(), nullable=False),
+        sa.Column("last_error", sa.String(length=1000), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("sent_at", sa.DateTime(), nullable=True),
+    )
+    op.create_index("ix_indexing_outbox_due", "indexing_outbox", ["status", "provider", "next_attempt_at"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_indexing_outbox_due", table_name="indexing_outbox")
+    op.drop_table("indexing_outbox")
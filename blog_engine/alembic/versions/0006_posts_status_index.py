@@ -0,0 +1,22 @@
+"""add (status, created_at) index to posts
+
+Revision ID: 0006_posts_status_index
+Revises: 0005_indexing_outbox
+Create Date: 2026-10-18
+"""
+
+from alembic import op
+
+
+revision = "0006_posts_status_index"
+down_revision = "0005_indexing_outbox"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_posts_status_created_at", "posts", ["status", "created_at"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_posts_status_created_at", table_name="posts")
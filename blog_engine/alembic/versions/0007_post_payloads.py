@@ -0,0 +1,71 @@
+"""move bulky post columns to post_payloads, add last_error/attempt_count
+
+Revision ID: 0007_post_payloads
+Revises: 0006_posts_status_index
+Create Date: 2026-10-18
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0007_post_payloads"
+down_revision = "0006_posts_status_index"
+branch_labels = None
+depends_on = None
+
+
+def _json_text(column: str, path: str) -> str:
+    if op.get_bind().dialect.name == "mysql":
+        return f"JSON_UNQUOTE(JSON_EXTRACT({column}, '{path}'))"
+    return f"json_extract({column}, '{path}')"
+
+
+def upgrade() -> None:
+    op.create_table(
+        "post_payloads",
+        sa.Column("post_id", sa.Integer(), sa.ForeignKey("posts.id", ondelete="CASCADE"), primary_key=True),
+        sa.Column("raw_input", sa.JSON(), nullable=True),
+        sa.Column("generated_content", sa.JSON(), nullable=True),
+        sa.Column("rendered_html", sa.Text(), nullable=True),
+    )
+    op.add_column("posts", sa.Column("last_error", sa.String(length=1000), nullable=True))
+    op.add_column("posts", sa.Column("attempt_count", sa.Integer(), nullable=False, server_default="0"))
+
+    op.execute(
+        "INSERT INTO post_payloads (post_id, raw_input, generated_content, rendered_html) "
+        "SELECT id, raw_input, generated_content, rendered_html FROM posts"
+    )
+    op.execute(
+        f"UPDATE posts SET last_error = SUBSTR({_json_text('raw_input', '$.last_error')}, 1, 1000) "
+        f"WHERE {_json_text('raw_input', '$.last_error')} IS NOT NULL"
+    )
+    remove_fn = "JSON_REMOVE" if op.get_bind().dialect.name == "mysql" else "json_remove"
+    op.execute(
+        f"UPDATE post_payloads SET raw_input = {remove_fn}(raw_input, '$.last_error') "
+        f"WHERE {_json_text('raw_input', '$.last_error')} IS NOT NULL"
+    )
+
+    with op.batch_alter_table("posts") as batch_op:
+        batch_op.drop_column("rendered_html")
+        batch_op.drop_column("generated_content")
+        batch_op.drop_column("raw_input")
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("posts") as batch_op:
+        batch_op.add_column(sa.Column("raw_input", sa.JSON(), nullable=True))
+        batch_op.add_column(sa.Column("generated_content", sa.JSON(), nullable=True))
+        batch_op.add_column(sa.Column("rendered_html", sa.Text(), nullable=True))
+
+    op.execute(
+        "UPDATE posts SET "
+        "raw_input = (SELECT raw_input FROM post_payloads WHERE post_payloads.post_id = posts.id), "
+        "generated_content = (SELECT generated_content FROM post_payloads WHERE post_payloads.post_id = posts.id), "
+        "rendered_html = (SELECT rendered_html FROM post_payloads WHERE post_payloads.post_id = posts.id)"
+    )
+
+    with op.batch_alter_table("posts") as batch_op:
+        batch_op.drop_column("attempt_count")
+        batch_op.drop_column("last_error")
+    op.drop_table("post_payloads")
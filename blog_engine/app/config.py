@@ -24,10 +24,16 @@ class Settings(BaseSettings):
     db_password_env: str = Field(default="BLOG_ENGINE_DB_PASSWORD", alias="DB_PASSWORD_ENV")
     db_charset: str = Field(default="utf8mb4", alias="DB_CHARSET")
     media_root: Path = Field(default=Path("./media"), alias="MEDIA_ROOT")
+    template_bytecode_cache_dir: str = Field(default="./.cache/jinja", alias="TEMPLATE_BYTECODE_CACHE_DIR")
     image_max_width: int = Field(default=1600, alias="IMAGE_MAX_WIDTH")
     image_max_height: int = Field(default=1600, alias="IMAGE_MAX_HEIGHT")
     image_webp_quality: int = Field(default=82, alias="IMAGE_WEBP_QUALITY")
     image_keep_original: bool = Field(default=False, alias="IMAGE_KEEP_ORIGINAL")
+    image_download_concurrency: int = Field(default=4, alias="IMAGE_DOWNLOAD_CONCURRENCY")
+    image_encode_workers: int = Field(default=2, alias="IMAGE_ENCODE_WORKERS")
+    image_max_download_mb: int = Field(default=25, alias="IMAGE_MAX_DOWNLOAD_MB")
+    image_cache_enabled: bool = Field(default=True, alias="IMAGE_CACHE_ENABLED")
+    image_cache_max_mb: int = Field(default=2048, alias="IMAGE_CACHE_MAX_MB")
 
     openai_api_key: str = Field(default="", alias="OPENAI_API_KEY")
     openai_api_key_env: str = Field(default="BLOG_ENGINE_OPENAI_API_KEY", alias="OPENAI_API_KEY_ENV")
@@ -41,6 +47,12 @@ class Settings(BaseSettings):
     wordpress_default_status: str = Field(default="publish", alias="WORDPRESS_DEFAULT_STATUS")
     wordpress_default_category: str = Field(default="", alias="WORDPRESS_DEFAULT_CATEGORY")
     wordpress_category_map: str = Field(default="ott:OTT 리뷰", alias="WORDPRESS_CATEGORY_MAP")
+    wordpress_http_pool_size: int = Field(default=8, alias="WORDPRESS_HTTP_POOL_SIZE")
+    wordpress_http_retries: int = Field(default=3, alias="WORDPRESS_HTTP_RETRIES")
+    wordpress_http_backoff_seconds: float = Field(default=0.5, alias="WORDPRESS_HTTP_BACKOFF_SECONDS")
+    wordpress_upload_concurrency: int = Field(default=3, alias="WORDPRESS_UPLOAD_CONCURRENCY")
+    wordpress_term_cache_ttl_seconds: int = Field(default=3600, alias="WORDPRESS_TERM_CACHE_TTL_SECONDS")
+    wordpress_term_cache_max_size: int = Field(default=5000, alias="WORDPRESS_TERM_CACHE_MAX_SIZE")
 
     google_service_account_file: str = Field(default="", alias="GOOGLE_SERVICE_ACCOUNT_FILE")
     google_indexing_scopes: str = Field(
@@ -49,13 +61,26 @@ class Settings(BaseSettings):
     naver_rss_ping_url: str = Field(
         default="https://searchadvisor.naver.com/ping", alias="NAVER_RSS_PING_URL"
     )
+    indexing_drain_interval_seconds: float = Field(default=10.0, alias="INDEXING_DRAIN_INTERVAL_SECONDS")
+    indexing_batch_size: int = Field(default=50, alias="INDEXING_BATCH_SIZE")
+    indexing_google_per_minute: int = Field(default=60, alias="INDEXING_GOOGLE_PER_MINUTE")
+    indexing_naver_per_minute: int = Field(default=30, alias="INDEXING_NAVER_PER_MINUTE")
+    indexing_max_attempts: int = Field(default=6, alias="INDEXING_MAX_ATTEMPTS")
+    indexing_retry_backoff_seconds: float = Field(default=60.0, alias="INDEXING_RETRY_BACKOFF_SECONDS")
 
     rate_limit: str = Field(default="30/minute", alias="RATE_LIMIT")
     auto_create_tables: bool = Field(default=True, alias="AUTO_CREATE_TABLES")
     processing_mode: str = Field(default="queue", alias="PROCESSING_MODE")
     batch_process_limit: int = Field(default=20, alias="BATCH_PROCESS_LIMIT")
+    bulk_generate_concurrency: int = Field(default=4, alias="BULK_GENERATE_CONCURRENCY")
     worker_random_delay_min_minutes: int = Field(default=0, alias="WORKER_RANDOM_DELAY_MIN_MINUTES")
     worker_random_delay_max_minutes: int = Field(default=35, alias="WORKER_RANDOM_DELAY_MAX_MINUTES")
+    worker_concurrency: int = Field(default=1, alias="WORKER_CONCURRENCY")
+    worker_heartbeat_seconds: int = Field(default=30, alias="WORKER_HEARTBEAT_SECONDS")
+    worker_stale_claim_seconds: int = Field(default=900, alias="WORKER_STALE_CLAIM_SECONDS")
+    worker_max_attempts: int = Field(default=3, alias="WORKER_MAX_ATTEMPTS")
+    worker_poll_min_seconds: float = Field(default=2.0, alias="WORKER_POLL_MIN_SECONDS")
+    worker_poll_max_seconds: float = Field(default=60.0, alias="WORKER_POLL_MAX_SECONDS")
 
     @property
     def sqlalchemy_database_url(self) -> str:
@@ -1,5 +1,7 @@
+import asyncio
+from collections.abc import Callable
 from datetime import datetime
-import html
+import hashlib
 from pathlib import Path
 import logging
 import re
@@ -7,25 +9,33 @@ import traceback
 from typing import Any
 from urllib.parse import urlparse, urlunparse
 
-import markdown as md
 from fastapi import Depends, FastAPI, Header, HTTPException, Request
 from slowapi import Limiter, _rate_limit_exceeded_handler
 from slowapi.errors import RateLimitExceeded
 from slowapi.util import get_remote_address
 from slugify import slugify
-from sqlalchemy import select
+from starlette.concurrency import run_in_threadpool
+from sqlalchemy import select, update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 from app.config import get_settings
-from app.database import Base, engine, get_db
+from app.database import Base, SessionLocal, engine, get_db
 from app.models.image import Image
-from app.models.post import Post
-from app.schemas.request import GeneratePostRequest
-from app.schemas.response import GeneratePostResponse, PostStatusResponse, PublishResponse
-from app.services.content_generator import ContentGenerator
+from app.models.media_asset import MediaAsset
+from app.models.post import PUBLISH_STEPS, Post
+from app.models.post_payload import PostPayload
+from app.schemas.request import GeneratePostRequest, GeneratePostsRequest
+from app.schemas.response import (
+    GeneratePostResponse,
+    GeneratePostsResponse,
+    PostStatusResponse,
+    PublishResponse,
+)
+from app.services.container import get_services
 from app.services.html_renderer import HtmlRenderer
-from app.services.image_engine import ImageEngine
-from app.services.indexing_service import IndexingService
+from app.services.markdown_engine import render_section_html
+from app.services.post_queue import CLAIMABLE_STATUSES, ClaimBudget, PostQueue
 from app.services.seo_engine import SeoEngine
 from app.services.wordpress_publisher import WordPressPublisher
 
@@ -42,6 +52,12 @@ app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
 def startup_sync_tables() -> None:
     if settings.auto_create_tables:
         Base.metadata.create_all(bind=engine)
+    get_services().indexing_outbox.start()
+
+
+@app.on_event("shutdown")
+def shutdown_indexing_outbox() -> None:
+    get_services().indexing_outbox.stop()
 
 
 def verify_admin_token(x_admin_token: str = Header(default="")) -> None:
@@ -54,18 +70,36 @@ def health() -> dict[str, str]:
     return {"status": "ok"}
 
 
-def _build_unique_slug(db: Session, base_slug: str, current_post_id: int) -> str:
+def _build_unique_slug(db: Session, base_slug: str, current_post_id: int, locking: bool = False) -> str:
     root_slug = base_slug or f"post-{current_post_id}"
-    slug = root_slug
-    index = 2
-    while True:
-        exists = db.execute(
-            select(Post.id).where(Post.slug == slug, Post.id != current_post_id)
-        ).scalar_one_or_none()
-        if not exists:
-            return slug
-        slug = f"{root_slug}-{index}"
-        index += 1
+    # One indexed prefix scan instead of probing root, root-2, root-3, ... one query each.
+    like_prefix = root_slug.replace("/", "//").replace("%", "/%").replace("_", "/_")
+    query = select(Post.slug).where(Post.slug.like(f"{like_prefix}%", escape="/"), Post.id != current_post_id)
+    if locking:
+        # Locking read sees rows committed after our snapshot (MySQL REPEATABLE READ).
+        query = query.with_for_update(read=True)
+    taken = set(db.scalars(query))
+    if root_slug not in taken:
+        return root_slug
+    suffix_pattern = re.compile(rf"^{re.escape(root_slug)}-(\d+)$")
+    suffixes = [int(match.group(1)) for slug in taken if (match := suffix_pattern.match(slug or ""))]
+    return f"{root_slug}-{max(suffixes, default=1) + 1}"
+
+
+def _assign_unique_slug(db: Session, post: Post, base_slug: str, attempts: int = 5) -> None:
+    # Flush everything else first so a rolled-back savepoint only undoes the slug.
+    db.flush()
+    for attempt in range(attempts):
+        slug = _build_unique_slug(db, base_slug, post.id, locking=attempt > 0)
+        try:
+            with db.begin_nested():
+                post.slug = slug
+                db.flush()
+            return
+        except IntegrityError:
+            # A concurrent worker committed the same slug between our read and write.
+            logger.info("slug collision, retrying | post_id=%s slug=%s", post.id, slug)
+    raise RuntimeError(f"Could not assign a unique slug for post {post.id} after {attempts} attempts")
 
 
 def _resolve_wp_category_name(post: Post) -> str | None:
@@ -129,43 +163,6 @@ def _compose_blog_title(provider_ko: str, work_title: str, generated_title: str)
     return f"{display_title}, {provider}에서 감상 가능"
 
 
-def _render_section_html(content: str) -> str:
-    normalized = _apply_style_placeholders(str(content or ""))
-    normalized = re.sub(r"([.!?])\s+(?=[A-Za-z0-9가-힣\"'(\[])",
-                        r"\1\n",
-                        normalized)
-    return md.markdown(
-        normalized,
-        extensions=["extra", "sane_lists", "nl2br"],
-        output_format="html5",
-    )
-
-
-def _apply_style_placeholders(text: str) -> str:
-    # AI placeholder -> styled html/markdown conversion
-    # {{B:...}}  => markdown bold
-    # {{HL:...}} => highlighted phrase
-    # {{ACC:...}} => accent phrase
-    out = str(text or "")
-
-    def _b(match: re.Match[str]) -> str:
-        inner = html.escape(match.group(1).strip())
-        return f"**{inner}**" if inner else ""
-
-    def _hl(match: re.Match[str]) -> str:
-        inner = html.escape(match.group(1).strip())
-        return f"<span class=\"be-hl\">{inner}</span>" if inner else ""
-
-    def _acc(match: re.Match[str]) -> str:
-        inner = html.escape(match.group(1).strip())
-        return f"<span class=\"be-acc\">{inner}</span>" if inner else ""
-
-    out = re.sub(r"\{\{B:(.*?)\}\}", _b, out, flags=re.DOTALL)
-    out = re.sub(r"\{\{HL:(.*?)\}\}", _hl, out, flags=re.DOTALL)
-    out = re.sub(r"\{\{ACC:(.*?)\}\}", _acc, out, flags=re.DOTALL)
-    return out
-
-
 def _to_public_url(url: str | None) -> str | None:
     raw = str(url or "").strip()
     if not raw:
@@ -201,13 +198,13 @@ def _to_relative_media_url(url: str | None) -> str | None:
 
 def _mark_post_failed(db: Session, post_id: int, error_detail: str) -> None:
     db.rollback()
-    failed_post = db.get(Post, post_id)
-    if failed_post:
-        failed_post.status = "failed"
-        raw_input = dict(failed_post.raw_input or {})
-        raw_input["last_error"] = str(error_detail)[:1000]
-        failed_post.raw_input = raw_input
-        db.commit()
+    # Plain column update: the payload blob is neither read nor rewritten.
+    db.execute(
+        update(Post)
+        .where(Post.id == post_id)
+        .values(status="failed", last_error=str(error_detail)[:1000])
+    )
+    db.commit()
 
 
 def _format_error(exc: Exception) -> str:
@@ -216,9 +213,43 @@ def _format_error(exc: Exception) -> str:
     return f"{exc.__class__.__name__}: {exc}" + (f" | {tail}" if tail else "")
 
 
-def _run_generation_pipeline(db: Session, post: Post, payload: GeneratePostRequest) -> str:
-    content_generator = ContentGenerator(settings)
-    generated = content_generator.generate(payload.model_dump())
+def _run_generation_pipeline(
+    db: Session,
+    post: Post,
+    payload: GeneratePostRequest,
+) -> str:
+    services = get_services()
+    generated = services.content_generator.generate(payload.model_dump())
+    local_paths = services.image_engine.download_and_convert_many([image.url for image in payload.images], post.id)
+    return _complete_generation(db, post, payload, generated, local_paths)
+
+
+async def _run_generation_pipeline_async(post_id: int, payload: GeneratePostRequest) -> str:
+    # OpenAI and image downloads are awaited without holding a threadpool worker;
+    # only the short DB/render/publish tail hops onto the threadpool.
+    services = get_services()
+    generated = await services.content_generator.agenerate(payload.model_dump())
+    local_paths = await services.image_engine.adownload_and_convert_many(
+        [image.url for image in payload.images], post_id
+    )
+
+    def _finish(db: Session) -> str:
+        post = db.get(Post, post_id)
+        if not post:
+            raise HTTPException(status_code=404, detail="Post not found")
+        return _complete_generation(db, post, payload, generated, local_paths)
+
+    return await run_in_threadpool(_with_session, _finish)
+
+
+def _complete_generation(
+    db: Session,
+    post: Post,
+    payload: GeneratePostRequest,
+    generated: dict[str, Any],
+    local_paths: list[Path],
+) -> str:
+    services = get_services()
     seo = SeoEngine.optimize(generated)
     work_title = str(payload.prompt_variables.get("title", "")).strip()
     provider_ko = str(payload.prompt_variables.get("primary_provider_ko", "")).strip()
@@ -226,10 +257,14 @@ def _run_generation_pipeline(db: Session, post: Post, payload: GeneratePostReque
     seo["seo_title"] = final_title
     seo["slug"] = slugify(final_title)[:120] or f"post-{post.id}"
 
-    image_engine = ImageEngine(settings)
+    # Regenerating a post replaces its images and restarts publishing; a known wp_post_id is
+    # kept so the existing WordPress post gets updated rather than duplicated.
+    for old_image in list(post.images):
+        db.delete(old_image)
+    post.publish_step = None
+
     stored_images: list[dict[str, str]] = []
-    for idx, image in enumerate(payload.images):
-        local_path = image_engine.download_and_convert(image.url, post.id, idx)
+    for idx, (image, local_path) in enumerate(zip(payload.images, local_paths)):
         stored_images.append({"path": str(local_path), "type": image.type})
         db.add(
             Image(
@@ -248,12 +283,11 @@ def _run_generation_pipeline(db: Session, post: Post, payload: GeneratePostReque
         {
             "heading": str(section.get("heading", "") or ""),
             "content": str(section.get("content", "") or ""),
-            "content_html": _render_section_html(str(section.get("content", "") or "")),
+            "content_html": render_section_html(str(section.get("content", "") or "")),
         }
         for section in generated.get("sections", [])
     ]
 
-    renderer = HtmlRenderer(Path(__file__).resolve().parent / "templates")
     cast_names = str(payload.prompt_variables.get("cast", "") or "").strip()
     cast_list = [x.strip() for x in cast_names.split(",") if x.strip()][:5]
     release_date = str(payload.prompt_variables.get("release_date", "") or "").strip()
@@ -268,7 +302,7 @@ def _run_generation_pipeline(db: Session, post: Post, payload: GeneratePostReque
         "genres": genres,
         "cast": cast_list,
     }
-    html = renderer.render(
+    html = services.renderer.render(
         payload.render_template,
         {
             "seo_title": seo["seo_title"],
@@ -290,7 +324,7 @@ def _run_generation_pipeline(db: Session, post: Post, payload: GeneratePostReque
     post.rendered_html = html
     post.seo_title = seo["seo_title"]
     post.meta_description = seo["meta_description"]
-    post.slug = _build_unique_slug(db, seo["slug"], post.id)
+    _assign_unique_slug(db, post, seo["slug"])
     post.status = "generated"
     db.commit()
 
@@ -300,42 +334,109 @@ def _run_generation_pipeline(db: Session, post: Post, payload: GeneratePostReque
     return post.status
 
 
-def _process_single_post(db: Session, post_id: int) -> str:
+def _begin_processing(
+    db: Session, post_id: int, claimed_by: str | None = None
+) -> tuple[Post, GeneratePostRequest | None]:
     post = db.get(Post, post_id)
     if not post:
         raise HTTPException(status_code=404, detail="Post not found")
-    if post.status not in {"draft", "queued"}:
-        return post.status
+    if claimed_by is not None:
+        # Claimed by PostQueue: already moved to processing; bail out if someone reclaimed it.
+        if post.status != "processing" or post.claimed_by != claimed_by:
+            return post, None
+    else:
+        # Same conditional claim as PostQueue: a daemon worker polling the queue may race us for this row.
+        claimed = db.execute(
+            update(Post)
+            .where(Post.id == post_id, Post.status.in_(CLAIMABLE_STATUSES))
+            .values(status="processing", attempt_count=Post.attempt_count + 1)
+        )
+        db.commit()
+        db.refresh(post)
+        if claimed.rowcount != 1:
+            return post, None
     if not isinstance(post.raw_input, dict):
         raise ValueError("Invalid raw_input payload")
 
     payload = GeneratePostRequest.model_validate(post.raw_input)
-    post.status = "processing"
-    db.commit()
-    db.refresh(post)
+    # Fail before the (paid) generation call rather than at render time.
+    if not get_services().renderer.has_template(payload.render_template):
+        raise ValueError(f"Unknown render_template: {payload.render_template}")
+    return post, payload
+
+
+def _process_single_post(
+    db: Session,
+    post_id: int,
+    claimed_by: str | None = None,
+    before_generate: Callable[[], bool] | None = None,
+) -> str:
+    post, payload = _begin_processing(db, post_id, claimed_by)
+    if payload is None:
+        return post.status
+    # Delay runs while the post is still claimed (and heartbeating), so a crash during the
+    # wait leaves it reclaimable instead of stranded in "generated".
+    if payload.auto_publish and before_generate is not None and not before_generate():
+        return _release_claim(db, post, claimed_by)
     return _run_generation_pipeline(db, post, payload)
 
 
-def _process_queue_posts(db: Session, limit: int) -> dict[str, Any]:
-    target_limit = max(1, limit)
-    post_ids = list(
-        db.execute(
-            select(Post.id)
-            .where(Post.status.in_(["draft", "queued"]))
-            .order_by(Post.created_at.asc())
-            .limit(target_limit)
-        ).scalars()
+def _release_claim(db: Session, post: Post, claimed_by: str | None) -> str:
+    # Shutdown requested mid-delay: hand the post back to the queue untouched, not counted as an attempt.
+    db.execute(
+        update(Post)
+        .where(Post.id == post.id, Post.status == "processing", Post.claimed_by == claimed_by)
+        .values(status="queued", claimed_by=None, heartbeat_at=None, attempt_count=Post.attempt_count - 1)
     )
+    db.commit()
+    db.refresh(post)
+    return post.status
+
+
+async def _process_single_post_async(post_id: int) -> str:
+    def _begin(db: Session) -> tuple[str, GeneratePostRequest | None]:
+        post, payload = _begin_processing(db, post_id)
+        return post.status, payload
+
+    status, payload = await run_in_threadpool(_with_session, _begin)
+    if payload is None:
+        return status
+    return await _run_generation_pipeline_async(post_id, payload)
+
+
+def _with_session(fn: Callable[..., Any], *args: Any) -> Any:
+    with SessionLocal() as db:
+        return fn(db, *args)
+
+
+def _process_queue_posts(
+    db: Session,
+    limit: int,
+    worker_id: str | None = None,
+    budget: ClaimBudget | None = None,
+    before_generate: Callable[[], bool] | None = None,
+) -> dict[str, Any]:
+    queue = PostQueue(settings, SessionLocal)
+    worker_id = worker_id or PostQueue.worker_id()
+    budget = budget or ClaimBudget(max(1, limit))
+    queue.reclaim_stale(db)
     result: dict[str, Any] = {
-        "requested": len(post_ids),
+        "requested": 0,
         "processed": 0,
         "failed": 0,
         "published": 0,
         "errors": [],
     }
-    for post_id in post_ids:
+    while budget.take():
+        post_id = queue.claim_next(db, worker_id)
+        if post_id is None:
+            break
+        result["requested"] += 1
         try:
-            final_status = _process_single_post(db, post_id)
+            with queue.heartbeat(post_id, worker_id):
+                final_status = _process_single_post(
+                    db, post_id, claimed_by=worker_id, before_generate=before_generate
+                )
             result["processed"] += 1
             if final_status == "published":
                 result["published"] += 1
@@ -352,24 +453,83 @@ def _publish_post_internal(db: Session, post: Post) -> PublishResponse:
     if not post.rendered_html or not post.seo_title or not post.slug:
         raise HTTPException(status_code=400, detail="Post is not ready for publishing")
 
-    publisher = WordPressPublisher(settings)
+    publisher = get_services().publisher
+    resumed_from = post.publish_step
+    images = sorted(post.images, key=lambda x: x.order)
+
+    # Each step commits its checkpoint, so a retry resumes after the last finished step.
+    # media_uploaded is also checkpointed per image: wp_media_url is committed as each upload finishes,
+    # so a retry after a partial failure only handles the images that are still missing.
+    missing_media = [image for image in images if not image.wp_media_url]
+    if not _publish_step_done(post, "media_uploaded") or missing_media:
+        _resolve_post_media(db, publisher, missing_media)
+        _checkpoint_publish(db, post, "media_uploaded")
+
+    if not _publish_step_done(post, "terms_resolved"):
+        post.wp_category_ids, post.wp_tag_ids = _resolve_post_terms(publisher, post)
+        _checkpoint_publish(db, post, "terms_resolved")
+
+    if not _publish_step_done(post, "wp_post_created"):
+        media_urls = {image.local_path: image.wp_media_url for image in images if image.wp_media_url}
+        featured_media_id = next((image.wp_media_id for image in images if image.wp_media_id), None)
+        # Replace locally-rendered image paths with final WordPress media URLs.
+        content_html = HtmlRenderer.rewrite_urls(post.rendered_html, media_urls)
+
+        existing_post_id = post.wp_post_id
+        if existing_post_id is None and resumed_from == "terms_resolved":
+            # The previous attempt may have created the post and died before recording it.
+            found = publisher.find_post_by_slug(post.slug)
+            existing_post_id = found.get("id") if found else None
+
+        wp_post = publisher.publish_post(
+            title=post.seo_title,
+            content=content_html,
+            slug=post.slug,
+            featured_media_id=featured_media_id,
+            category_ids=list(post.wp_category_ids or []),
+            tag_ids=list(post.wp_tag_ids or []),
+            post_id=existing_post_id,
+        )
 
-    featured_media_id = None
-    content_html = post.rendered_html
-    for image in sorted(post.images, key=lambda x: x.order):
-        media = publisher.upload_media(Path(image.local_path))
-        image.wp_media_id = media.get("id")
-        wp_media_url = media.get("source_url") or ((media.get("guid") or {}).get("rendered"))
-        if settings.wordpress_media_use_relative_urls:
-            wp_media_url = _to_relative_media_url(wp_media_url)
-        else:
-            wp_media_url = _to_public_url(wp_media_url)
-        if wp_media_url and content_html:
-            # Replace locally-rendered image path with final WordPress media URL.
-            content_html = content_html.replace(image.local_path, wp_media_url)
-        if featured_media_id is None:
-            featured_media_id = image.wp_media_id
+        post.wp_post_id = wp_post.get("id")
+        post.wp_url = _to_public_url(wp_post.get("link"))
+        post.status = "published"
+        post.published_at = datetime.utcnow()
+        _checkpoint_publish(db, post, "wp_post_created")
+
+    if not _publish_step_done(post, "indexed"):
+        # Only recorded here; the outbox drainer notifies search engines in the background.
+        outbox = get_services().indexing_outbox
+        if post.wp_url:
+            outbox.enqueue(db, post.wp_url)
+        _checkpoint_publish(db, post, "indexed")
+        outbox.wake()
+
+    if post.status != "published":
+        # Every step was already done (e.g. a manual retry of a post marked failed afterwards).
+        post.status = "published"
+        db.commit()
 
+    return PublishResponse(
+        post_id=post.id,
+        status=post.status,
+        wp_post_id=post.wp_post_id,
+        wp_url=post.wp_url,
+    )
+
+
+def _publish_step_done(post: Post, step: str) -> bool:
+    if post.publish_step not in PUBLISH_STEPS:
+        return False
+    return PUBLISH_STEPS.index(post.publish_step) >= PUBLISH_STEPS.index(step)
+
+
+def _checkpoint_publish(db: Session, post: Post, step: str) -> None:
+    post.publish_step = step
+    db.commit()
+
+
+def _resolve_post_terms(publisher: WordPressPublisher, post: Post) -> tuple[list[int], list[int]]:
     category_ids: list[int] = []
     category_name = _resolve_wp_category_name(post)
     if category_name:
@@ -389,59 +549,151 @@ def _publish_post_internal(db: Session, post: Post) -> PublishResponse:
             except Exception:
                 # Tag creation failure should not block publishing.
                 continue
+    return category_ids, tag_ids
 
-    wp_post = publisher.publish_post(
-        title=post.seo_title,
-        content=content_html,
-        slug=post.slug,
-        featured_media_id=featured_media_id,
-        category_ids=category_ids,
-        tag_ids=tag_ids,
-    )
 
-    post.wp_post_id = wp_post.get("id")
-    post.wp_url = _to_public_url(wp_post.get("link"))
-    post.status = "published"
-    post.published_at = datetime.utcnow()
-    db.commit()
+def _resolve_post_media(db: Session, publisher: WordPressPublisher, images: list[Image]) -> None:
+    # Reuse order: the image's own attachment, then any attachment with identical bytes, then upload.
+    hashes = [_file_sha256(Path(image.local_path)) for image in images]
+    candidate_ids: list[int | None] = [image.wp_media_id for image in images]
 
-    if post.wp_url:
-        indexing = IndexingService(settings)
-        indexing.notify(post.wp_url)
+    unknown_hashes = {hashes[index] for index, media_id in enumerate(candidate_ids) if not media_id}
+    assets: dict[str, MediaAsset] = {}
+    if unknown_hashes:
+        assets = {
+            asset.content_hash: asset
+            for asset in db.scalars(select(MediaAsset).where(MediaAsset.content_hash.in_(unknown_hashes)))
+        }
+        for index, media_id in enumerate(candidate_ids):
+            if not media_id and hashes[index] in assets:
+                candidate_ids[index] = assets[hashes[index]].wp_media_id
+
+    # Verify every candidate still exists; attachments deleted in wp-admin get re-uploaded.
+    check_ids = sorted({media_id for media_id in candidate_ids if media_id})
+    existing = dict(zip(check_ids, publisher.get_media_many(check_ids)))
+    # Identical files within the same post are uploaded once.
+    pending: dict[str, list[int]] = {}
+    for index, media_id in enumerate(candidate_ids):
+        media = existing.get(media_id) if media_id else None
+        if media is None:
+            pending.setdefault(hashes[index], []).append(index)
+        else:
+            _apply_media(images[index], media)
+    upload_hashes = list(pending)
+
+    def _on_uploaded(position: int, media: dict[str, Any]) -> None:
+        # Committed per upload: if a sibling upload fails, the retry reuses this attachment.
+        digest = upload_hashes[position]
+        for index in pending[digest]:
+            _apply_media(images[index], media)
+        _remember_media_asset(db, assets.get(digest), digest, int(media["id"]))
+        db.commit()
 
-    return PublishResponse(
-        post_id=post.id,
-        status=post.status,
-        wp_post_id=post.wp_post_id,
-        wp_url=post.wp_url,
+    publisher.upload_media_many(
+        [Path(images[pending[digest][0]].local_path) for digest in upload_hashes],
+        on_uploaded=_on_uploaded,
     )
 
 
+def _apply_media(image: Image, media: dict[str, Any]) -> None:
+    image.wp_media_id = media.get("id")
+    wp_media_url = media.get("source_url") or ((media.get("guid") or {}).get("rendered"))
+    if settings.wordpress_media_use_relative_urls:
+        image.wp_media_url = _to_relative_media_url(wp_media_url)
+    else:
+        image.wp_media_url = _to_public_url(wp_media_url)
+
+
+def _remember_media_asset(db: Session, asset: MediaAsset | None, content_hash: str, wp_media_id: int) -> None:
+    if asset is not None:
+        asset.wp_media_id = wp_media_id
+        return
+    try:
+        with db.begin_nested():
+            db.add(MediaAsset(content_hash=content_hash, wp_media_id=wp_media_id))
+    except IntegrityError:
+        # Another worker indexed the same file concurrently; its attachment is equally valid.
+        pass
+
+
+def _file_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as file_obj:
+        for chunk in iter(lambda: file_obj.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _ensure_render_templates(payloads: list[GeneratePostRequest]) -> None:
+    renderer = get_services().renderer
+    unknown = sorted({p.render_template for p in payloads if not renderer.has_template(p.render_template)})
+    if unknown:
+        raise HTTPException(status_code=422, detail=f"Unknown render_template: {', '.join(unknown)}")
+
+
+def _insert_posts(db: Session, payloads: list[GeneratePostRequest], status: str) -> list[int]:
+    # One transaction for the whole burst; the ORM batches the INSERTs.
+    posts = [Post(raw_input=payload.model_dump(), status=status) for payload in payloads]
+    db.add_all(posts)
+    db.commit()
+    return [post.id for post in posts]
+
+
 @app.post("/generate-post", response_model=GeneratePostResponse)
 @limiter.limit(settings.rate_limit)
-def generate_post(
+async def generate_post(
     request: Request,
     payload: GeneratePostRequest,
-    db: Session = Depends(get_db),
     _: None = Depends(verify_admin_token),
 ) -> GeneratePostResponse:
     run_mode = (settings.processing_mode or "sync").strip().lower()
-    post = Post(raw_input=payload.model_dump(), status="queued" if run_mode == "queue" else "draft")
-    db.add(post)
-    db.commit()
-    db.refresh(post)
+    status = "queued" if run_mode == "queue" else "draft"
+    _ensure_render_templates([payload])
+    [post_id] = await run_in_threadpool(_with_session, _insert_posts, [payload], status)
 
     if run_mode == "queue":
-        return GeneratePostResponse(post_id=post.id, status=post.status)
+        return GeneratePostResponse(post_id=post_id, status=status)
 
     try:
-        final_status = _process_single_post(db, post.id)
-        return GeneratePostResponse(post_id=post.id, status=final_status)
+        final_status = await _process_single_post_async(post_id)
+        return GeneratePostResponse(post_id=post_id, status=final_status)
     except Exception as exc:
-        _mark_post_failed(db, post.id, str(exc))
+        await run_in_threadpool(_with_session, _mark_post_failed, post_id, str(exc))
         raise HTTPException(status_code=500, detail=f"Generation failed: {exc}") from exc
 
 
+@app.post("/generate-posts", response_model=GeneratePostsResponse)
+@limiter.limit(settings.rate_limit)
+async def generate_posts(
+    request: Request,
+    payload: GeneratePostsRequest,
+    _: None = Depends(verify_admin_token),
+) -> GeneratePostsResponse:
+    run_mode = (settings.processing_mode or "sync").strip().lower()
+    status = "queued" if run_mode == "queue" else "draft"
+    _ensure_render_templates(payload.posts)
+    post_ids = await run_in_threadpool(_with_session, _insert_posts, payload.posts, status)
+
+    if run_mode == "queue":
+        return GeneratePostsResponse(posts=[GeneratePostResponse(post_id=x, status=status) for x in post_ids])
+
+    # Bounded so a 100-post batch does not fire 100 OpenAI completions and their downloads at once.
+    concurrency = asyncio.Semaphore(max(1, settings.bulk_generate_concurrency))
+
+    async def _process(post_id: int) -> GeneratePostResponse:
+        try:
+            async with concurrency:
+                final_status = await _process_single_post_async(post_id)
+        except Exception as exc:
+            await run_in_threadpool(_with_session, _mark_post_failed, post_id, str(exc))
+            logger.exception("batch generation failed | post_id=%s", post_id)
+            final_status = "failed"
+        return GeneratePostResponse(post_id=post_id, status=final_status)
+
+    results = await asyncio.gather(*(_process(post_id) for post_id in post_ids))
+    return GeneratePostsResponse(posts=list(results))
+
+
 @app.post("/publish/{post_id}", response_model=PublishResponse)
 @limiter.limit(settings.rate_limit)
 def publish_post(
@@ -456,11 +708,7 @@ def publish_post(
     try:
         return _publish_post_internal(db, post)
     except Exception as exc:
-        db.rollback()
-        failed_post = db.get(Post, post.id)
-        if failed_post:
-            failed_post.status = "failed"
-            db.commit()
+        _mark_post_failed(db, post_id, f"Publish failed: {exc}")
         raise HTTPException(status_code=500, detail=f"Publish failed: {exc}") from exc
 
 
@@ -484,17 +732,31 @@ def get_status(
     db: Session = Depends(get_db),
     _: None = Depends(verify_admin_token),
 ) -> PostStatusResponse:
-    post = db.get(Post, post_id)
-    if not post:
+    # Column projection: never pulls raw_input or rendered_html from post_payloads.
+    row = db.execute(
+        select(
+            Post.id,
+            Post.status,
+            Post.slug,
+            Post.seo_title,
+            Post.wp_post_id,
+            Post.published_at,
+            PostPayload.generated_content,
+            Post.last_error,
+        )
+        .outerjoin(PostPayload, PostPayload.post_id == Post.id)
+        .where(Post.id == post_id)
+    ).one_or_none()
+    if row is None:
         raise HTTPException(status_code=404, detail="Post not found")
 
     return PostStatusResponse(
-        post_id=post.id,
-        status=post.status,
-        slug=post.slug,
-        seo_title=post.seo_title,
-        wp_post_id=post.wp_post_id,
-        published_at=post.published_at,
-        generated_content=post.generated_content,
-        last_error=str((post.raw_input or {}).get("last_error", "") or "") or None,
+        post_id=row.id,
+        status=row.status,
+        slug=row.slug,
+        seo_title=row.seo_title,
+        wp_post_id=row.wp_post_id,
+        published_at=row.published_at,
+        generated_content=row.generated_content,
+        last_error=str(row.last_error or "") or None,
     )
@@ -1,4 +1,7 @@
 from app.models.image import Image
+from app.models.indexing_job import IndexingJob
+from app.models.media_asset import MediaAsset
 from app.models.post import Post
+from app.models.post_payload import PostPayload
 
-__all__ = ["Post", "Image"]
+__all__ = ["Post", "PostPayload", "Image", "MediaAsset", "IndexingJob"]
@@ -12,6 +12,7 @@ class Image(Base):
     original_url: Mapped[str] = mapped_column(String(500), nullable=False)
     local_path: Mapped[str] = mapped_column(String(500), nullable=False)
     wp_media_id: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    wp_media_url: Mapped[str | None] = mapped_column(String(500), nullable=True)
     order: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
 
     post = relationship("Post", back_populates="images")
@@ -1,18 +1,20 @@
 from datetime import datetime
 
-from sqlalchemy import JSON, DateTime, Integer, String, Text
+from sqlalchemy import JSON, DateTime, Index, Integer, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database import Base
+from app.models.post_payload import PostPayload
+
+PUBLISH_STEPS = ("media_uploaded", "terms_resolved", "wp_post_created", "indexed")
 
 
 class Post(Base):
     __tablename__ = "posts"
+    # Serves the queue scan: WHERE status IN (...) ORDER BY created_at.
+    __table_args__ = (Index("ix_posts_status_created_at", "status", "created_at"),)
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
-    raw_input: Mapped[dict] = mapped_column(JSON, nullable=False)
-    generated_content: Mapped[dict | None] = mapped_column(JSON, nullable=True)
-    rendered_html: Mapped[str | None] = mapped_column(Text, nullable=True)
     seo_title: Mapped[str | None] = mapped_column(String(255), nullable=True)
     meta_description: Mapped[str | None] = mapped_column(String(255), nullable=True)
     slug: Mapped[str | None] = mapped_column(String(255), nullable=True, unique=True)
@@ -21,5 +23,45 @@ class Post(Base):
     wp_url: Mapped[str | None] = mapped_column(String(500), nullable=True)
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
     published_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+    claimed_by: Mapped[str | None] = mapped_column(String(64), nullable=True)
+    heartbeat_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+    # Last finished publish checkpoint (see PUBLISH_STEPS); retries resume after it.
+    publish_step: Mapped[str | None] = mapped_column(String(30), nullable=True)
+    wp_category_ids: Mapped[list | None] = mapped_column(JSON, nullable=True)
+    wp_tag_ids: Mapped[list | None] = mapped_column(JSON, nullable=True)
+    last_error: Mapped[str | None] = mapped_column(String(1000), nullable=True)
+    attempt_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
 
     images = relationship("Image", back_populates="post", cascade="all, delete-orphan")
+    payload = relationship("PostPayload", back_populates="post", uselist=False, cascade="all, delete-orphan")
+
+    # raw_input / generated_content / rendered_html live in post_payloads; these proxies keep
+    # the old attribute API and only touch the side table when actually read or written.
+    @property
+    def raw_input(self) -> dict | None:
+        return self.payload.raw_input if self.payload is not None else None
+
+    @raw_input.setter
+    def raw_input(self, value: dict | None) -> None:
+        self._ensure_payload().raw_input = value
+
+    @property
+    def generated_content(self) -> dict | None:
+        return self.payload.generated_content if self.payload is not None else None
+
+    @generated_content.setter
+    def generated_content(self, value: dict | None) -> None:
+        self._ensure_payload().generated_content = value
+
+    @property
+    def rendered_html(self) -> str | None:
+        return self.payload.rendered_html if self.payload is not None else None
+
+    @rendered_html.setter
+    def rendered_html(self, value: str | None) -> None:
+        self._ensure_payload().rendered_html = value
+
+    def _ensure_payload(self) -> PostPayload:
+        if self.payload is None:
+            self.payload = PostPayload()
+        return self.payload
@@ -0,0 +1,17 @@
+from sqlalchemy import JSON, ForeignKey, Text
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+
+from app.database import Base
+
+
+class PostPayload(Base):
+    """Bulky per-post blobs, kept off the hot posts row and loaded only when a post is worked on."""
+
+    __tablename__ = "post_payloads"
+
+    post_id: Mapped[int] = mapped_column(ForeignKey("posts.id", ondelete="CASCADE"), primary_key=True)
+    raw_input: Mapped[dict | None] = mapped_column(JSON, nullable=True)
+    generated_content: Mapped[dict | None] = mapped_column(JSON, nullable=True)
+    rendered_html: Mapped[str | None] = mapped_column(Text, nullable=True)
+
+    post = relationship("Post", back_populates="payload")
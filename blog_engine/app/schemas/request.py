@@ -18,3 +18,7 @@ class GeneratePostRequest(BaseModel):
     auto_publish: bool = False
 
     model_config = ConfigDict(extra="allow")
+
+
+class GeneratePostsRequest(BaseModel):
+    posts: list[GeneratePostRequest] = Field(min_length=1, max_length=100)
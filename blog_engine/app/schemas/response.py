@@ -9,6 +9,10 @@ class GeneratePostResponse(BaseModel):
     status: str
 
 
+class GeneratePostsResponse(BaseModel):
+    posts: list[GeneratePostResponse]
+
+
 class PublishResponse(BaseModel):
     post_id: int
     status: str
@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+
+from app.config import get_settings
+from app.database import SessionLocal
+from app.services.content_generator import ContentGenerator
+from app.services.html_renderer import HtmlRenderer
+from app.services.image_engine import ImageEngine
+from app.services.indexing_outbox import IndexingOutbox
+from app.services.indexing_service import IndexingService
+from app.services.wordpress_publisher import WordPressPublisher
+
+TEMPLATE_DIR = Path(__file__).resolve().parents[1] / "templates"
+
+
+@dataclass(frozen=True)
+class ServiceContainer:
+    content_generator: ContentGenerator
+    image_engine: ImageEngine
+    renderer: HtmlRenderer
+    publisher: WordPressPublisher
+    indexing: IndexingService
+    indexing_outbox: IndexingOutbox
+
+
+@lru_cache
+def get_services() -> ServiceContainer:
+    # Process-wide: API app and worker share clients, HTTP pools and compiled templates.
+    settings = get_settings()
+    indexing = IndexingService(settings)
+    cache_dir = settings.template_bytecode_cache_dir.strip()
+    renderer = HtmlRenderer(
+        TEMPLATE_DIR,
+        bytecode_cache_dir=Path(cache_dir) if cache_dir else None,
+        auto_reload=settings.app_env == "dev",
+    )
+    renderer.precompile()
+    return ServiceContainer(
+        content_generator=ContentGenerator(settings),
+        image_engine=ImageEngine(settings),
+        renderer=renderer,
+        publisher=WordPressPublisher(settings),
+        indexing=indexing,
+        indexing_outbox=IndexingOutbox(settings, indexing, SessionLocal),
+    )
@@ -2,7 +2,7 @@ import json
 from string import Formatter
 from typing import Any
 
-from openai import OpenAI
+from openai import AsyncOpenAI, OpenAI
 
 from app.config import Settings
 
@@ -17,6 +17,7 @@ class ContentGenerator:
         self.settings = settings
         api_key = settings.effective_openai_api_key
         self.client = OpenAI(api_key=api_key) if api_key else None
+        self.async_client = AsyncOpenAI(api_key=api_key) if api_key else None
 
     @staticmethod
     def render_prompt(template: str, variables: dict[str, Any]) -> str:
@@ -28,18 +29,26 @@ class ContentGenerator:
         return rendered
 
     def generate(self, payload: dict[str, Any]) -> dict[str, Any]:
+        if not self.client:
+            raise RuntimeError("OPENAI API key is not configured")
+        completion = self.client.chat.completions.create(**self._completion_kwargs(payload))
+        return self._content_from_completion(completion)
+
+    async def agenerate(self, payload: dict[str, Any]) -> dict[str, Any]:
+        if not self.async_client:
+            raise RuntimeError("OPENAI API key is not configured")
+        completion = await self.async_client.chat.completions.create(**self._completion_kwargs(payload))
+        return self._content_from_completion(completion)
+
+    def _completion_kwargs(self, payload: dict[str, Any]) -> dict[str, Any]:
         prompt_template = payload.get("prompt_template", "")
         prompt_variables = payload.get("prompt_variables", {})
         rendered_prompt = self.render_prompt(prompt_template, prompt_variables)
         system_role = payload.get("system_role") or "You generate structured blog content in JSON only."
-
-        if not self.client:
-            raise RuntimeError("OPENAI API key is not configured")
-
-        completion = self.client.chat.completions.create(
-            model=self.settings.openai_model,
-            temperature=0.78,
-            messages=[
+        return {
+            "model": self.settings.openai_model,
+            "temperature": 0.78,
+            "messages": [
                 {"role": "system", "content": system_role},
                 {
                     "role": "user",
@@ -50,8 +59,9 @@ class ContentGenerator:
                     ),
                 },
             ],
-        )
+        }
 
+    def _content_from_completion(self, completion: Any) -> dict[str, Any]:
         raw_text = completion.choices[0].message.content or "{}"
         content = self._parse_json(raw_text)
         self._validate_schema(content)
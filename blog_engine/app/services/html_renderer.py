@@ -1,35 +1,72 @@
 from pathlib import Path
+import re
 from typing import Any
 
-import markdown
-from jinja2 import Environment, FileSystemLoader, select_autoescape
-from markupsafe import Markup
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, select_autoescape
+from markupsafe import Markup, escape
+
+from app.services.markdown_engine import render_markdown
+
+
+TEMPLATE_EXTENSIONS = ("html",)
 
 
 class HtmlRenderer:
-    def __init__(self, template_dir: Path):
+    def __init__(self, template_dir: Path, bytecode_cache_dir: Path | None = None, auto_reload: bool = True):
+        bytecode_cache = None
+        if bytecode_cache_dir is not None:
+            # Compiled template code survives restarts, so worker cold starts skip parsing.
+            bytecode_cache_dir.mkdir(parents=True, exist_ok=True)
+            bytecode_cache = FileSystemBytecodeCache(str(bytecode_cache_dir))
         self.env = Environment(
             loader=FileSystemLoader(str(template_dir)),
             autoescape=select_autoescape(["html", "xml"]),
             trim_blocks=True,
             lstrip_blocks=True,
+            auto_reload=auto_reload,
+            bytecode_cache=bytecode_cache,
         )
         self.env.filters["md"] = self._markdown_to_html
+        self._template_names: frozenset[str] = frozenset()
+
+    def precompile(self) -> list[str]:
+        """Load every template once so rendering never compiles on the hot path."""
+        self._template_names = frozenset(self.env.list_templates(extensions=TEMPLATE_EXTENSIONS))
+        for name in sorted(self._template_names):
+            self.env.get_template(name)
+        return sorted(self._template_names)
+
+    def has_template(self, template_name: str) -> bool:
+        if template_name in self._template_names:
+            return True
+        # Templates added after startup (dev auto-reload) are picked up on first use.
+        self._template_names = frozenset(self.env.list_templates(extensions=TEMPLATE_EXTENSIONS))
+        return template_name in self._template_names
 
     @staticmethod
     def _markdown_to_html(value: Any) -> Markup:
-        text = str(value or "")
-        html = markdown.markdown(
-            text,
-            extensions=[
-                "extra",
-                "sane_lists",
-                "nl2br",
-            ],
-            output_format="html5",
-        )
-        return Markup(html)
+        return Markup(render_markdown(str(value or "")))
 
     def render(self, template_name: str, context: dict[str, Any]) -> str:
+        if not self.has_template(template_name):
+            raise ValueError(f"Unknown render_template: {template_name}")
         template = self.env.get_template(template_name)
         return template.render(**context)
+
+    @staticmethod
+    def rewrite_urls(html: str, url_map: dict[str, str]) -> str:
+        # One regex pass over the document; matches anywhere, so src and srcset candidates
+        # are both rewritten. Autoescaped spellings of each path are matched as well.
+        if not html or not url_map:
+            return html
+        lookup: dict[str, str] = {}
+        for source, target in url_map.items():
+            if not source:
+                continue
+            lookup[source] = target
+            lookup[str(escape(source))] = target
+        if not lookup:
+            return html
+        # Longest first so a path never shadows a longer one that starts with it.
+        pattern = re.compile("|".join(re.escape(key) for key in sorted(lookup, key=len, reverse=True)))
+        return pattern.sub(lambda match: lookup[match.group(0)], html)
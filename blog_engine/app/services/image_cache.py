@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+from contextlib import contextmanager
+import hashlib
+import os
+from pathlib import Path
+import shutil
+import sqlite3
+import threading
+import time
+from typing import Iterator
+
+
+class ImageCache:
+    """Content-addressed store of converted WebP files under ``media_root/.cache``.
+
+    Entries are keyed by source URL plus the resize/quality settings, so changing
+    those settings naturally misses instead of serving stale output.
+    """
+
+    def __init__(self, root: Path, max_bytes: int):
+        self.root = root
+        self.max_bytes = max(0, int(max_bytes))
+        self.index_path = root / "index.sqlite3"
+        self._lock = threading.Lock()
+        self.root.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS image_cache (
+                    key TEXT PRIMARY KEY,
+                    path TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    last_used REAL NOT NULL
+                )
+                """
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_image_cache_last_used ON image_cache(last_used)")
+
+    @staticmethod
+    def make_key(image_url: str, max_size: tuple[int, int], quality: int) -> str:
+        raw = f"{image_url}|{max_size[0]}x{max_size[1]}|q{quality}|webp"
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def fetch(self, key: str, target: Path) -> bool:
+        """Materialize a cached entry at ``target``; returns False on a miss."""
+        with self._connect() as conn:
+            row = conn.execute("SELECT path FROM image_cache WHERE key = ?", (key,)).fetchone()
+            if not row:
+                return False
+            cached = self.root / row[0]
+            if not cached.exists():
+                conn.execute("DELETE FROM image_cache WHERE key = ?", (key,))
+                return False
+            conn.execute("UPDATE image_cache SET last_used = ? WHERE key = ?", (time.time(), key))
+
+        try:
+            self._link_or_copy(cached, target)
+        except FileNotFoundError:
+            # A concurrent _evict removed the file after the lookup; treat it as a miss.
+            with self._connect() as conn:
+                conn.execute("DELETE FROM image_cache WHERE key = ? AND path = ?", (key, row[0]))
+            return False
+        return True
+
+    def store(self, key: str, source: Path) -> None:
+        relative = Path(key[:2]) / f"{key}.webp"
+        cached = self.root / relative
+        cached.parent.mkdir(parents=True, exist_ok=True)
+        if not cached.exists():
+            # Copy via a temp name so a concurrent reader never links a half-written file.
+            tmp_path = cached.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+            self._link_or_copy(source, tmp_path)
+            os.replace(tmp_path, cached)
+
+        with self._connect() as conn:
+            conn.execute(
+                """
+                INSERT INTO image_cache (key, path, size, last_used)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT(key) DO UPDATE SET path = excluded.path, size = excluded.size, last_used = excluded.last_used
+                """,
+                (key, relative.as_posix(), cached.stat().st_size, time.time()),
+            )
+        self._evict()
+
+    def _evict(self) -> None:
+        if self.max_bytes <= 0:
+            return
+        with self._lock, self._connect() as conn:
+            total = int(conn.execute("SELECT COALESCE(SUM(size), 0) FROM image_cache").fetchone()[0])
+            if total <= self.max_bytes:
+                return
+            rows = conn.execute("SELECT key, path, size FROM image_cache ORDER BY last_used ASC").fetchall()
+            for key, relative, size in rows:
+                if total <= self.max_bytes:
+                    break
+                # Posts keep their own hard link, so removing the cache entry never breaks them.
+                (self.root / relative).unlink(missing_ok=True)
+                conn.execute("DELETE FROM image_cache WHERE key = ?", (key,))
+                total -= int(size)
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        conn = sqlite3.connect(self.index_path, timeout=30)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    @staticmethod
+    def _link_or_copy(source: Path, target: Path) -> None:
+        target.unlink(missing_ok=True)
+        try:
+            os.link(source, target)
+        except OSError:
+            shutil.copyfile(source, target)
@@ -1,48 +1,265 @@
 from __future__ import annotations
 
+import asyncio
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
-from io import BytesIO
+import multiprocessing
 from pathlib import Path
+import threading
 from urllib.parse import urlparse
 
+import httpx
 import requests
+from requests.adapters import HTTPAdapter
 from PIL import Image as PILImage
-from PIL import ImageOps
+from PIL import ExifTags, ImageOps
 
 from app.config import Settings
+from app.services.image_cache import ImageCache
+
+_encode_pool: ProcessPoolExecutor | None = None
+_encode_pool_lock = threading.Lock()
+
+
+def _get_encode_pool(max_workers: int) -> ProcessPoolExecutor:
+    global _encode_pool
+    with _encode_pool_lock:
+        if _encode_pool is None:
+            # forkserver: the API/worker processes are threaded, and forking while another thread
+            # holds a lock (logging, SQLAlchemy pool, ...) can deadlock the child.
+            _encode_pool = ProcessPoolExecutor(
+                max_workers=max_workers,
+                mp_context=multiprocessing.get_context("forkserver"),
+            )
+        return _encode_pool
+
+
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+
+def _encode_webp(source_path: str, webp_path: str, max_size: tuple[int, int], quality: int) -> str:
+    # Module-level so it can be pickled into the encode process pool; takes a path, not bytes.
+    with PILImage.open(source_path) as img:
+        # JPEG DCT scaling: decode at 1/2, 1/4 or 1/8 resolution (never below the requested size),
+        # so a 4K original is never materialized as a full-size bitmap. No-op for other formats.
+        img.draft("RGB", _draft_size(img, max_size))
+        normalized = ImageOps.exif_transpose(img).convert("RGB")
+        normalized.thumbnail(max_size, PILImage.Resampling.LANCZOS)
+        normalized.save(webp_path, "WEBP", quality=quality, method=6)
+    return webp_path
+
+
+def _draft_size(img: PILImage.Image, max_size: tuple[int, int]) -> tuple[int, int]:
+    # The size thumbnail() will produce, in the file's stored orientation: draft() only picks a
+    # scale when both stored dimensions stay at or above it. Orientations 5-8 swap width/height
+    # once exif_transpose runs, so fit the stored image into the swapped box.
+    width, height = img.size
+    max_width, max_height = max_size
+    if img.getexif().get(ExifTags.Base.Orientation, 1) in {5, 6, 7, 8}:
+        max_width, max_height = max_height, max_width
+    scale = min(1.0, max_width / width, max_height / height)
+    return max(1, int(width * scale)), max(1, int(height * scale))
+
+
+class ImageTooLargeError(ValueError):
+    pass
 
 
 class ImageEngine:
     def __init__(self, settings: Settings):
         self.settings = settings
+        self.download_concurrency = max(1, int(settings.image_download_concurrency))
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=self.download_concurrency)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self._async_client: httpx.AsyncClient | None = None
+        self._async_limiter: asyncio.Semaphore | None = None
+        self._async_loop: asyncio.AbstractEventLoop | None = None
+        self.cache: ImageCache | None = None
+        if settings.image_cache_enabled:
+            self.cache = ImageCache(settings.media_root / ".cache", int(settings.image_cache_max_mb) * 1024 * 1024)
+
+    def download_and_convert_many(self, image_urls: list[str], post_id: int) -> list[Path]:
+        if not image_urls:
+            return []
+
+        targets = [self._target_paths(url, post_id, order) for order, url in enumerate(image_urls)]
+        encode_workers = int(self.settings.image_encode_workers)
+        encode_pool = _get_encode_pool(encode_workers) if encode_workers > 0 else None
+        max_size = self._max_size()
+        quality = self._quality()
+
+        # Downloads share the pooled session; CPU-bound WebP encoding goes to the process pool.
+        def _fetch_and_encode(order: int) -> Path:
+            original_path, webp_path = targets[order]
+            cache_key = self._cache_key(image_urls[order])
+            if self._fetch_cached(cache_key, webp_path):
+                return webp_path
+            source_path = self._download(image_urls[order], original_path)
+            try:
+                if encode_pool is None:
+                    _encode_webp(str(source_path), str(webp_path), max_size, quality)
+                else:
+                    encode_pool.submit(_encode_webp, str(source_path), str(webp_path), max_size, quality).result()
+            finally:
+                self._discard_download(source_path)
+            self._store_cached(cache_key, webp_path)
+            return webp_path
+
+        workers = min(self.download_concurrency, len(image_urls))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="image-fetch") as pool:
+            futures: list[Future[Path]] = [pool.submit(_fetch_and_encode, order) for order in range(len(image_urls))]
+            return [future.result() for future in futures]
+
+    async def adownload_and_convert_many(self, image_urls: list[str], post_id: int) -> list[Path]:
+        if not image_urls:
+            return []
 
-    def download_and_convert(self, image_url: str, post_id: int, order: int) -> Path:
+        targets = [self._target_paths(url, post_id, order) for order, url in enumerate(image_urls)]
+        encode_workers = int(self.settings.image_encode_workers)
+        encode_pool = _get_encode_pool(encode_workers) if encode_workers > 0 else None
+        max_size = self._max_size()
+        quality = self._quality()
+        client = self._get_async_client()
+        limiter = self._get_async_limiter()
+        loop = asyncio.get_running_loop()
+
+        async def _fetch_and_encode(order: int) -> Path:
+            original_path, webp_path = targets[order]
+            cache_key = self._cache_key(image_urls[order])
+            if await asyncio.to_thread(self._fetch_cached, cache_key, webp_path):
+                return webp_path
+            async with limiter:
+                source_path = await self._adownload(client, image_urls[order], original_path)
+            try:
+                # encode_pool=None falls back to the loop's default thread executor.
+                await loop.run_in_executor(encode_pool, _encode_webp, str(source_path), str(webp_path), max_size, quality)
+            finally:
+                self._discard_download(source_path)
+            await asyncio.to_thread(self._store_cached, cache_key, webp_path)
+            return webp_path
+
+        return list(await asyncio.gather(*(_fetch_and_encode(order) for order in range(len(image_urls)))))
+
+    def _get_async_client(self) -> httpx.AsyncClient:
+        # Created lazily so it binds to the running event loop (uvicorn's), not import time.
+        self._bind_async_loop()
+        if self._async_client is None:
+            # No pool timeout: waiting for a free connection is bounded by the shared limiter, not an error.
+            self._async_client = httpx.AsyncClient(
+                timeout=httpx.Timeout(30, pool=None),
+                follow_redirects=True,
+                limits=httpx.Limits(max_connections=self.download_concurrency),
+            )
+        return self._async_client
+
+    def _get_async_limiter(self) -> asyncio.Semaphore:
+        # Shared by every post generating concurrently, so together they never exceed the client's
+        # connection limit.
+        self._bind_async_loop()
+        if self._async_limiter is None:
+            self._async_limiter = asyncio.Semaphore(self.download_concurrency)
+        return self._async_limiter
+
+    def _bind_async_loop(self) -> None:
+        # Client and limiter belong to one event loop; a new loop (e.g. a CLI asyncio.run) gets fresh ones.
+        loop = asyncio.get_running_loop()
+        if self._async_loop is not loop:
+            self._async_loop = loop
+            self._async_client = None
+            self._async_limiter = None
+
+    def _target_paths(self, image_url: str, post_id: int, order: int) -> tuple[Path, Path]:
         year = datetime.utcnow().year
         base_dir = self.settings.media_root / str(year) / str(post_id)
         base_dir.mkdir(parents=True, exist_ok=True)
 
         ext = self._guess_extension(image_url)
-        original_path = base_dir / f"{order:02d}_original{ext}"
-        webp_path = base_dir / f"{order:02d}.webp"
+        return base_dir / f"{order:02d}_original{ext}", base_dir / f"{order:02d}.webp"
+
+    def _download(self, image_url: str, original_path: Path) -> Path:
+        # Streamed to disk chunk by chunk; the body is never held in memory as a whole.
+        part_path = original_path.with_name(original_path.name + ".part")
+        limit = self._max_download_bytes()
+        try:
+            with self.session.get(image_url, timeout=30, stream=True) as response:
+                response.raise_for_status()
+                self._check_declared_size(image_url, response.headers.get("Content-Length"), limit)
+                written = 0
+                with part_path.open("wb") as file_obj:
+                    for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                        written += len(chunk)
+                        if written > limit:
+                            raise ImageTooLargeError(f"Image exceeds {limit} bytes: {image_url}")
+                        file_obj.write(chunk)
+        except BaseException:
+            part_path.unlink(missing_ok=True)
+            raise
+        return self._finish_download(part_path, original_path)
 
-        response = requests.get(image_url, timeout=30)
-        response.raise_for_status()
-        content = response.content
+    async def _adownload(self, client: httpx.AsyncClient, image_url: str, original_path: Path) -> Path:
+        part_path = original_path.with_name(original_path.name + ".part")
+        limit = self._max_download_bytes()
+        try:
+            async with client.stream("GET", image_url) as response:
+                response.raise_for_status()
+                self._check_declared_size(image_url, response.headers.get("Content-Length"), limit)
+                written = 0
+                # 64 KiB local writes are short enough to do inline on the event loop.
+                with part_path.open("wb") as file_obj:
+                    async for chunk in response.aiter_bytes(DOWNLOAD_CHUNK_SIZE):
+                        written += len(chunk)
+                        if written > limit:
+                            raise ImageTooLargeError(f"Image exceeds {limit} bytes: {image_url}")
+                        file_obj.write(chunk)
+        except BaseException:
+            part_path.unlink(missing_ok=True)
+            raise
+        return self._finish_download(part_path, original_path)
 
+    def _finish_download(self, part_path: Path, original_path: Path) -> Path:
         if self.settings.image_keep_original:
-            original_path.write_bytes(content)
+            # The streamed file simply becomes the kept original; no second write.
+            part_path.replace(original_path)
+            return original_path
+        return part_path
 
-        with PILImage.open(BytesIO(content)) as img:
-            normalized = ImageOps.exif_transpose(img).convert("RGB")
-            max_size = (
-                max(320, int(self.settings.image_max_width)),
-                max(320, int(self.settings.image_max_height)),
-            )
-            normalized.thumbnail(max_size, PILImage.Resampling.LANCZOS)
-            quality = min(95, max(55, int(self.settings.image_webp_quality)))
-            normalized.save(webp_path, "WEBP", quality=quality, method=6)
+    def _discard_download(self, source_path: Path) -> None:
+        if not self.settings.image_keep_original:
+            source_path.unlink(missing_ok=True)
+
+    def _max_download_bytes(self) -> int:
+        return max(1, int(self.settings.image_max_download_mb)) * 1024 * 1024
+
+    @staticmethod
+    def _check_declared_size(image_url: str, content_length: str | None, limit: int) -> None:
+        if content_length and content_length.isdigit() and int(content_length) > limit:
+            raise ImageTooLargeError(f"Image exceeds {limit} bytes (Content-Length={content_length}): {image_url}")
+
+    def _cache_key(self, image_url: str) -> str | None:
+        if self.cache is None:
+            return None
+        return ImageCache.make_key(image_url, self._max_size(), self._quality())
+
+    def _fetch_cached(self, cache_key: str | None, webp_path: Path) -> bool:
+        if self.cache is None or cache_key is None:
+            return False
+        return self.cache.fetch(cache_key, webp_path)
+
+    def _store_cached(self, cache_key: str | None, webp_path: Path) -> None:
+        if self.cache is None or cache_key is None:
+            return
+        self.cache.store(cache_key, webp_path)
+
+    def _max_size(self) -> tuple[int, int]:
+        return (
+            max(320, int(self.settings.image_max_width)),
+            max(320, int(self.settings.image_max_height)),
+        )
 
-        return webp_path
+    def _quality(self) -> int:
+        return min(95, max(55, int(self.settings.image_webp_quality)))
 
     @staticmethod
     def _guess_extension(url: str) -> str:
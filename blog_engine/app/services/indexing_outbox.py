@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from datetime import datetime, timedelta
+import logging
+import threading
+import time
+
+from sqlalchemy import select, update
+from sqlalchemy.orm import Session
+
+from app.config import Settings
+from app.models.indexing_job import IndexingJob
+from app.services.indexing_service import IndexingService
+
+DUE_STATUSES = ("pending", "sending")
+GOOGLE_BATCH_MAX = 100
+MAX_BACKOFF_SECONDS = 6 * 3600
+
+logger = logging.getLogger("blog_engine.indexing")
+
+
+class RateLimiter:
+    """Token bucket refilled continuously at `per_minute` tokens per minute."""
+
+    def __init__(self, per_minute: int):
+        self.capacity = max(1, per_minute)
+        self.rate = self.capacity / 60.0
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def take(self, wanted: int) -> int:
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            granted = min(int(self._tokens), max(0, wanted))
+            self._tokens -= granted
+            return granted
+
+    def refund(self, count: int) -> None:
+        with self._lock:
+            self._tokens = min(self.capacity, self._tokens + max(0, count))
+
+
+class IndexingOutbox:
+    """Search-engine notifications persisted at publish time and sent by a background drainer."""
+
+    def __init__(self, settings: Settings, indexing: IndexingService, session_factory: Callable[[], Session]):
+        self.settings = settings
+        self.indexing = indexing
+        self.session_factory = session_factory
+        self._limiters = {
+            "google": RateLimiter(settings.indexing_google_per_minute),
+            "naver": RateLimiter(settings.indexing_naver_per_minute),
+        }
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def enqueue(self, db: Session, url: str) -> None:
+        # Rows commit together with the caller's publish checkpoint.
+        for provider in self.indexing.providers():
+            db.add(IndexingJob(url=url, provider=provider, status="pending", attempts=0))
+
+    def wake(self) -> None:
+        self._wake.set()
+
+    def drain(self) -> dict[str, int]:
+        result = {"sent": 0, "retried": 0, "failed": 0}
+        for provider in self.indexing.providers():
+            limiter = self._limiters[provider]
+            granted = limiter.take(max(1, self.settings.indexing_batch_size))
+            if granted == 0:
+                continue
+            with self.session_factory() as db:
+                jobs = self._claim_due(db, provider, granted)
+                limiter.refund(granted - len(jobs))
+                if not jobs:
+                    continue
+                errors = self._send(provider, [job.url for job in jobs])
+                now = datetime.utcnow()
+                for job in jobs:
+                    error = errors.get(job.url, "no response from provider")
+                    if error is None:
+                        job.status = "done"
+                        job.sent_at = now
+                        job.last_error = None
+                        result["sent"] += 1
+                        continue
+                    job.attempts += 1
+                    job.last_error = error[:1000]
+                    if job.attempts >= max(1, self.settings.indexing_max_attempts):
+                        job.status = "failed"
+                        result["failed"] += 1
+                        logger.warning("indexing gave up | provider=%s url=%s error=%s", provider, job.url, error)
+                    else:
+                        delay = self.settings.indexing_retry_backoff_seconds * (2 ** (job.attempts - 1))
+                        job.status = "pending"
+                        job.next_attempt_at = now + timedelta(seconds=min(MAX_BACKOFF_SECONDS, delay))
+                        result["retried"] += 1
+                db.commit()
+        return result
+
+    def start(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="indexing-outbox", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 10.0) -> None:
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout=timeout)
+            self._thread = None
+
+    def _run(self) -> None:
+        interval = max(1.0, self.settings.indexing_drain_interval_seconds)
+        while not self._stop.is_set():
+            try:
+                self.drain()
+            except Exception:
+                logger.exception("indexing drain failed")
+            self._wake.wait(interval)
+            self._wake.clear()
+
+    def _claim_due(self, db: Session, provider: str, limit: int) -> list[IndexingJob]:
+        now = datetime.utcnow()
+        # A claim leases the row by pushing next_attempt_at out; a crashed drainer's rows become due again.
+        lease_until = now + timedelta(seconds=max(60.0, self.settings.indexing_retry_backoff_seconds))
+        rows = db.execute(
+            select(IndexingJob.id, IndexingJob.next_attempt_at)
+            .where(
+                IndexingJob.provider == provider,
+                IndexingJob.status.in_(DUE_STATUSES),
+                IndexingJob.next_attempt_at <= now,
+            )
+            .order_by(IndexingJob.next_attempt_at.asc())
+            .limit(limit)
+        ).all()
+        claimed_ids: list[int] = []
+        for job_id, due_at in rows:
+            claimed = db.execute(
+                update(IndexingJob)
+                .where(
+                    IndexingJob.id == job_id,
+                    IndexingJob.status.in_(DUE_STATUSES),
+                    IndexingJob.next_attempt_at == due_at,
+                )
+                .values(status="sending", next_attempt_at=lease_until)
+            )
+            if claimed.rowcount == 1:
+                claimed_ids.append(job_id)
+        db.commit()
+        if not claimed_ids:
+            return []
+        return list(db.scalars(select(IndexingJob).where(IndexingJob.id.in_(claimed_ids))))
+
+    def _send(self, provider: str, urls: list[str]) -> dict[str, str | None]:
+        errors: dict[str, str | None] = {}
+        if provider == "google":
+            for start in range(0, len(urls), GOOGLE_BATCH_MAX):
+                chunk = urls[start : start + GOOGLE_BATCH_MAX]
+                try:
+                    errors.update(self.indexing.notify_google_batch(chunk))
+                except Exception as exc:
+                    errors.update({url: str(exc) for url in chunk})
+            return errors
+
+        for url in urls:
+            try:
+                self.indexing.notify_naver(url)
+                errors[url] = None
+            except Exception as exc:
+                errors[url] = str(exc)
+        return errors
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import threading
 from typing import Any
 
 import requests
@@ -12,35 +13,59 @@ from app.config import Settings
 class IndexingService:
     def __init__(self, settings: Settings):
         self.settings = settings
+        self._credentials: service_account.Credentials | None = None
+        self._credentials_lock = threading.Lock()
+        # googleapiclient service objects are not thread-safe; build one per thread and reuse it.
+        self._local = threading.local()
+        self.http = requests.Session()
 
-    def notify(self, url: str) -> dict[str, Any]:
-        results: dict[str, Any] = {}
+    def providers(self) -> list[str]:
+        providers: list[str] = []
         if self.settings.google_service_account_file:
-            try:
-                results["google"] = self._notify_google(url)
-            except Exception as exc:
-                results["google_error"] = str(exc)
-
-        try:
-            results["naver"] = self._notify_naver(url)
-        except Exception as exc:
-            results["naver_error"] = str(exc)
-
-        return results
-
-    def _notify_google(self, url: str) -> dict[str, Any]:
-        credentials = service_account.Credentials.from_service_account_file(
-            self.settings.google_service_account_file,
-            scopes=[scope.strip() for scope in self.settings.google_indexing_scopes.split(",") if scope.strip()],
-        )
-        service = build("indexing", "v3", credentials=credentials, cache_discovery=False)
-        response = (
-            service.urlNotifications()
-            .publish(body={"url": url, "type": "URL_UPDATED"})
-            .execute()
-        )
-        return response
+            providers.append("google")
+        if self.settings.naver_rss_ping_url:
+            providers.append("naver")
+        return providers
+
+    def notify_google_batch(self, urls: list[str]) -> dict[str, str | None]:
+        """Send URL_UPDATED for up to 100 URLs in one batch HTTP request; returns url -> error or None."""
+        errors: dict[str, str | None] = {}
+
+        def _callback(request_id: str, response: Any, exception: Exception | None) -> None:
+            errors[urls[int(request_id)]] = str(exception) if exception is not None else None
+
+        service = self._google_service()
+        batch = service.new_batch_http_request(callback=_callback)
+        for index, url in enumerate(urls):
+            batch.add(
+                service.urlNotifications().publish(body={"url": url, "type": "URL_UPDATED"}),
+                request_id=str(index),
+            )
+        batch.execute()
+        return errors
+
+    def notify_naver(self, url: str) -> dict[str, Any]:
+        result = self._notify_naver(url)
+        if result["status_code"] >= 400:
+            raise RuntimeError(f"Naver ping failed: status={result['status_code']}, body={result['text']}")
+        return result
+
+    def _google_credentials(self) -> service_account.Credentials:
+        with self._credentials_lock:
+            if self._credentials is None:
+                self._credentials = service_account.Credentials.from_service_account_file(
+                    self.settings.google_service_account_file,
+                    scopes=[scope.strip() for scope in self.settings.google_indexing_scopes.split(",") if scope.strip()],
+                )
+            return self._credentials
+
+    def _google_service(self) -> Any:
+        service = getattr(self._local, "google_service", None)
+        if service is None:
+            service = build("indexing", "v3", credentials=self._google_credentials(), cache_discovery=False)
+            self._local.google_service = service
+        return service
 
     def _notify_naver(self, url: str) -> dict[str, Any]:
-        response = requests.get(self.settings.naver_rss_ping_url, params={"url": url}, timeout=15)
+        response = self.http.get(self.settings.naver_rss_ping_url, params={"url": url}, timeout=15)
         return {"status_code": response.status_code, "text": response.text[:200]}
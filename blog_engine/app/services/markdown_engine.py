@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import html
+import re
+import threading
+
+import markdown
+
+MARKDOWN_EXTENSIONS = ["extra", "sane_lists", "nl2br"]
+
+# Innermost placeholder first: the body may not contain another "{{", so nested markup resolves inside-out.
+_PLACEHOLDER_RE = re.compile(r"\{\{(B|HL|ACC):([^{}]*(?:(?:\{(?!\{)|\}(?!\}))[^{}]*)*)\}\}")
+_SENTENCE_BREAK_RE = re.compile(r"([.!?])\s+(?=[A-Za-z0-9가-힣\"'(\[])")
+
+_local = threading.local()
+
+
+def _markdown() -> markdown.Markdown:
+    # Markdown instances keep per-document state, so each thread gets its own and resets it per call.
+    instance = getattr(_local, "markdown", None)
+    if instance is None:
+        instance = markdown.Markdown(extensions=MARKDOWN_EXTENSIONS, output_format="html5")
+        _local.markdown = instance
+    return instance
+
+
+def render_markdown(text: str) -> str:
+    instance = _markdown()
+    instance.reset()
+    return instance.convert(str(text or ""))
+
+
+# Private-use code points never produced by the model; they stand in for markup that an inner
+# placeholder already produced, so escaping the outer body cannot mangle it.
+_FRAGMENT_OPEN = "\ue000"
+_FRAGMENT_CLOSE = "\ue001"
+_FRAGMENT_RE = re.compile(f"{_FRAGMENT_OPEN}(\\d+){_FRAGMENT_CLOSE}")
+
+
+def _placeholder_markup(kind: str, inner: str) -> str:
+    if kind == "B":
+        return f"**{inner}**"
+    if kind == "HL":
+        return f"<span class=\"be-hl\">{inner}</span>"
+    return f"<span class=\"be-acc\">{inner}</span>"
+
+
+def _replace_flat(match: re.Match[str]) -> str:
+    inner = html.escape(match.group(2).strip())
+    return _placeholder_markup(match.group(1), inner) if inner else ""
+
+
+def apply_style_placeholders(text: str) -> str:
+    # AI placeholder -> styled html/markdown conversion
+    # {{B:...}}  => markdown bold
+    # {{HL:...}} => highlighted phrase
+    # {{ACC:...}} => accent phrase
+    out = str(text or "").replace(_FRAGMENT_OPEN, "").replace(_FRAGMENT_CLOSE, "")
+    # Fast path: one pass straight to markup. If nothing matches afterwards, no placeholder enclosed
+    # another, so no markup ever sat inside an escaped body.
+    flat = _PLACEHOLDER_RE.sub(_replace_flat, out)
+    if "{{" not in flat or not _PLACEHOLDER_RE.search(flat):
+        return flat
+
+    fragments: list[str] = []
+
+    def _replace(match: re.Match[str]) -> str:
+        # html.escape leaves fragment tokens intact, so only the literal text of the body is escaped.
+        inner = html.escape(match.group(2).strip())
+        if not inner:
+            return ""
+        fragments.append(_placeholder_markup(match.group(1), inner))
+        return f"{_FRAGMENT_OPEN}{len(fragments) - 1}{_FRAGMENT_CLOSE}"
+
+    while "{{" in out:
+        out, count = _PLACEHOLDER_RE.subn(_replace, out)
+        if not count:
+            break
+
+    def _expand(match: re.Match[str]) -> str:
+        return _FRAGMENT_RE.sub(_expand, fragments[int(match.group(1))])
+
+    return _FRAGMENT_RE.sub(_expand, out)
+
+
+def render_section_html(content: str) -> str:
+    normalized = apply_style_placeholders(str(content or ""))
+    normalized = _SENTENCE_BREAK_RE.sub(r"\1\n", normalized)
+    return render_markdown(normalized)
@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+import logging
+import os
+import socket
+import threading
+
+from sqlalchemy import select, update
+from sqlalchemy.orm import Session
+
+from app.config import Settings
+from app.models.post import Post
+
+CLAIMABLE_STATUSES = ("draft", "queued")
+SKIP_LOCKED_DIALECTS = {"mysql", "postgresql"}
+
+logger = logging.getLogger("blog_engine.queue")
+
+
+class ClaimBudget:
+    """Thread-safe countdown shared by workers so a run never claims more than `limit` posts."""
+
+    def __init__(self, limit: int):
+        self._remaining = max(0, limit)
+        self._lock = threading.Lock()
+
+    def take(self) -> bool:
+        with self._lock:
+            if self._remaining <= 0:
+                return False
+            self._remaining -= 1
+            return True
+
+
+class PostQueue:
+    def __init__(self, settings: Settings, session_factory: Callable[[], Session]):
+        self.settings = settings
+        self.session_factory = session_factory
+
+    @staticmethod
+    def worker_id(index: int = 0) -> str:
+        return f"{socket.gethostname()}:{os.getpid()}:{index}"[:64]
+
+    def claim_next(self, db: Session, worker_id: str) -> int | None:
+        now = datetime.utcnow()
+        next_id = (
+            select(Post.id)
+            .where(Post.status.in_(CLAIMABLE_STATUSES))
+            .order_by(Post.created_at.asc())
+            .limit(1)
+        )
+        if db.get_bind().dialect.name in SKIP_LOCKED_DIALECTS:
+            post_id = db.execute(next_id.with_for_update(skip_locked=True)).scalar_one_or_none()
+            if post_id is None:
+                db.rollback()
+                return None
+            db.execute(
+                update(Post)
+                .where(Post.id == post_id)
+                .values(
+                    status="processing",
+                    claimed_by=worker_id,
+                    heartbeat_at=now,
+                    attempt_count=Post.attempt_count + 1,
+                )
+            )
+            db.commit()
+            return post_id
+
+        # No SKIP LOCKED: optimistic claim, the conditional UPDATE decides the winner.
+        for _ in range(5):
+            post_id = db.execute(next_id).scalar_one_or_none()
+            if post_id is None:
+                db.rollback()
+                return None
+            claimed = db.execute(
+                update(Post)
+                .where(Post.id == post_id, Post.status.in_(CLAIMABLE_STATUSES))
+                .values(
+                    status="processing",
+                    claimed_by=worker_id,
+                    heartbeat_at=now,
+                    attempt_count=Post.attempt_count + 1,
+                )
+            )
+            db.commit()
+            if claimed.rowcount == 1:
+                return post_id
+        return None
+
+    def reclaim_stale(self, db: Session) -> int:
+        cutoff = datetime.utcnow() - timedelta(seconds=max(60, self.settings.worker_stale_claim_seconds))
+        max_attempts = max(1, self.settings.worker_max_attempts)
+        stale = (Post.status == "processing", Post.heartbeat_at.is_not(None), Post.heartbeat_at < cutoff)
+        # A post that keeps taking its worker down (OOM, a crash in the image codecs) must not be retried forever.
+        abandoned = db.execute(
+            update(Post)
+            .where(*stale, Post.attempt_count >= max_attempts)
+            .values(
+                status="failed",
+                claimed_by=None,
+                heartbeat_at=None,
+                last_error=f"worker stopped responding on {max_attempts} attempts; not requeued",
+            )
+        )
+        result = db.execute(
+            update(Post)
+            .where(*stale)
+            .values(status="queued", claimed_by=None, heartbeat_at=None)
+        )
+        db.commit()
+        if abandoned.rowcount:
+            logger.error("failed stale processing posts | count=%s max_attempts=%s", abandoned.rowcount, max_attempts)
+        if result.rowcount:
+            logger.warning("reclaimed stale processing posts | count=%s", result.rowcount)
+        return int(result.rowcount or 0)
+
+    @contextmanager
+    def heartbeat(self, post_id: int, worker_id: str) -> Iterator[None]:
+        interval = max(1, self.settings.worker_heartbeat_seconds)
+        stop = threading.Event()
+
+        def _beat() -> None:
+            while not stop.wait(interval):
+                try:
+                    with self.session_factory() as db:
+                        db.execute(
+                            update(Post)
+                            .where(Post.id == post_id, Post.claimed_by == worker_id, Post.status == "processing")
+                            .values(heartbeat_at=datetime.utcnow())
+                        )
+                        db.commit()
+                except Exception:
+                    logger.warning("heartbeat failed | post_id=%s worker=%s", post_id, worker_id, exc_info=True)
+
+        thread = threading.Thread(target=_beat, name=f"heartbeat-{post_id}", daemon=True)
+        thread.start()
+        try:
+            yield
+        finally:
+            stop.set()
+            thread.join(timeout=5)
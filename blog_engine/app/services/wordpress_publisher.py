@@ -1,21 +1,63 @@
 from __future__ import annotations
 
+from collections import OrderedDict
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+import html
 from pathlib import Path
 import mimetypes
+import threading
+import time
 from typing import Any
 
 import requests
+from requests.adapters import HTTPAdapter
 from requests.auth import HTTPBasicAuth
 from slugify import slugify
+from urllib3.util.retry import Retry
 
 from app.config import Settings
 
+REST_STYLE_PRETTY = "wp-json"
+REST_STYLE_QUERY = "rest_route"
+
 
 class WordPressPublisher:
+    # base_url -> REST URL style that answered, remembered for the process lifetime.
+    _rest_styles: dict[str, str] = {}
+    # (base_url, taxonomy) -> shared name/id cache, so every publisher in the process reuses it.
+    _term_caches: dict[tuple[str, str], TermCache] = {}
+    _term_caches_lock = threading.Lock()
+
     def __init__(self, settings: Settings):
         self.settings = settings
         self.base_url = settings.wordpress_base_url.rstrip("/")
         self.auth = HTTPBasicAuth(settings.wordpress_username, settings.wordpress_app_password)
+        self.session = self._build_session()
+
+    def _build_session(self) -> requests.Session:
+        retry = Retry(
+            total=max(0, self.settings.wordpress_http_retries),
+            backoff_factor=self.settings.wordpress_http_backoff_seconds,
+            status_forcelist=(429, 500, 502, 503, 504),
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(
+            pool_connections=2,
+            pool_maxsize=max(1, self.settings.wordpress_http_pool_size),
+            max_retries=retry,
+        )
+        session = requests.Session()
+        session.auth = self.auth
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
+    def _rest_url(self, style: str, path: str) -> str:
+        if style == REST_STYLE_QUERY:
+            return f"{self.base_url}/?rest_route={path}"
+        return f"{self.base_url}/wp-json{path}"
 
     def _headers(self) -> dict[str, str]:
         return {"Accept": "application/json"}
@@ -26,31 +68,41 @@ class WordPressPublisher:
         path: str,
         *,
         headers: dict[str, str] | None = None,
+        params: dict[str, Any] | None = None,
         json: dict[str, Any] | None = None,
         data: Any = None,
         files: Any = None,
+        missing_ok: bool = False,
     ) -> requests.Response:
-        urls = [
-            f"{self.base_url}/wp-json{path}",
-            f"{self.base_url}/?rest_route={path}",
-        ]
+        cached_style = self._rest_styles.get(self.base_url)
+        styles = [cached_style] if cached_style else [REST_STYLE_PRETTY, REST_STYLE_QUERY]
         last_response: requests.Response | None = None
-        for url in urls:
-            response = requests.request(
+        for style in styles:
+            url = self._rest_url(style, path)
+            if hasattr(data, "seek"):
+                data.seek(0)
+            response = self.session.request(
                 method,
                 url,
                 headers=headers,
-                auth=self.auth,
+                params=params,
                 json=json,
                 data=data,
                 files=files,
                 timeout=30,
             )
+            if missing_ok and self._is_missing_resource(response):
+                # The route answered with a WP REST error, so the style is valid; only the object is gone.
+                if not cached_style:
+                    self._rest_styles[self.base_url] = style
+                return response
             if response.status_code != 404:
                 if response.status_code >= 400:
                     raise RuntimeError(
                         f"WordPress REST error: status={response.status_code}, url={url}, body={response.text[:1000]}"
                     )
+                if not cached_style:
+                    self._rest_styles[self.base_url] = style
                 return response
             last_response = response
 
@@ -61,17 +113,86 @@ class WordPressPublisher:
             )
         raise RuntimeError("WordPress REST endpoint not reachable")
 
-    def upload_media(self, file_path: Path) -> dict[str, Any]:
-        mime_type = mimetypes.guess_type(file_path.name)[0] or "application/octet-stream"
-        file_bytes = file_path.read_bytes()
+    @staticmethod
+    def _is_missing_resource(response: requests.Response) -> bool:
+        if response.status_code not in (404, 410):
+            return False
+        try:
+            code = str(response.json().get("code") or "")
+        except ValueError:
+            return False
+        return code.startswith("rest_") and code != "rest_no_route"
+
+    def get_media(self, media_id: int) -> dict[str, Any] | None:
         response = self._request_with_rest_fallback(
-            "POST",
-            "/wp/v2/media",
+            "GET",
+            f"/wp/v2/media/{int(media_id)}",
             headers=self._headers(),
-            files={"file": (file_path.name, file_bytes, mime_type)},
+            params={"_fields": "id,source_url,guid"},
+            missing_ok=True,
         )
+        if response.status_code >= 400:
+            return None
+        return response.json()
+
+    def get_media_many(self, media_ids: list[int]) -> list[dict[str, Any] | None]:
+        if not media_ids:
+            return []
+        workers = min(max(1, self.settings.wordpress_upload_concurrency), len(media_ids))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="wp-media") as pool:
+            return list(pool.map(self.get_media, media_ids))
+
+    def upload_media(self, file_path: Path) -> dict[str, Any]:
+        mime_type = mimetypes.guess_type(file_path.name)[0] or "application/octet-stream"
+        headers = {
+            **self._headers(),
+            "Content-Type": mime_type,
+            "Content-Disposition": f'attachment; filename="{file_path.name}"',
+        }
+        # Raw-body upload streams the file from disk instead of building a multipart copy in memory.
+        with file_path.open("rb") as file_obj:
+            response = self._request_with_rest_fallback(
+                "POST",
+                "/wp/v2/media",
+                headers=headers,
+                data=file_obj,
+            )
         return response.json()
 
+    def upload_media_many(
+        self,
+        file_paths: list[Path],
+        on_uploaded: Callable[[int, dict[str, Any]], None] | None = None,
+    ) -> list[dict[str, Any]]:
+        """Upload files concurrently; results are returned in input order.
+
+        `on_uploaded(index, media)` runs in the calling thread as each upload finishes, so callers can
+        persist the attachment id before a sibling upload fails. The first upload error is raised only
+        after every other upload has finished and been reported.
+        """
+        if not file_paths:
+            return []
+        workers = min(max(1, self.settings.wordpress_upload_concurrency), len(file_paths))
+        results: list[dict[str, Any]] = [{} for _ in file_paths]
+        first_error: BaseException | None = None
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="wp-upload") as pool:
+            futures: dict[Future[dict[str, Any]], int] = {
+                pool.submit(self.upload_media, path): index for index, path in enumerate(file_paths)
+            }
+            for future in as_completed(futures):
+                index = futures[future]
+                try:
+                    results[index] = future.result()
+                except Exception as exc:
+                    if first_error is None:
+                        first_error = exc
+                    continue
+                if on_uploaded is not None:
+                    on_uploaded(index, results[index])
+        if first_error is not None:
+            raise first_error
+        return results
+
     def publish_post(
         self,
         title: str,
@@ -80,6 +201,7 @@ class WordPressPublisher:
         featured_media_id: int | None = None,
         category_ids: list[int] | None = None,
         tag_ids: list[int] | None = None,
+        post_id: int | None = None,
     ) -> dict[str, Any]:
         payload = {
             "title": title,
@@ -94,70 +216,152 @@ class WordPressPublisher:
         if tag_ids:
             payload["tags"] = tag_ids
 
+        # An existing post id updates that post in place instead of creating a duplicate.
         response = self._request_with_rest_fallback(
             "POST",
-            "/wp/v2/posts",
+            f"/wp/v2/posts/{int(post_id)}" if post_id else "/wp/v2/posts",
             headers=self._headers(),
             json=payload,
         )
         return response.json()
 
-    def ensure_category(self, category_name: str) -> int:
-        category_name = category_name.strip()
-        if not category_name:
-            raise ValueError("Category name is required")
-
+    def find_post_by_slug(self, slug: str) -> dict[str, Any] | None:
         response = self._request_with_rest_fallback(
             "GET",
-            "/wp/v2/categories",
+            "/wp/v2/posts",
             headers=self._headers(),
+            params={
+                "slug": slug,
+                "status": "publish,future,draft,pending,private",
+                "_fields": "id,link",
+            },
         )
-        categories = response.json()
-        if isinstance(categories, list):
-            for cat in categories:
-                if str(cat.get("name", "")).strip().lower() == category_name.lower():
-                    cat_id = cat.get("id")
-                    if isinstance(cat_id, int):
-                        return cat_id
+        posts = response.json()
+        return posts[0] if isinstance(posts, list) and posts else None
 
-        create_response = self._request_with_rest_fallback(
-            "POST",
-            "/wp/v2/categories",
-            headers=self._headers(),
-            json={"name": category_name, "slug": slugify(category_name)},
-        )
-        created = create_response.json()
-        cat_id = created.get("id")
-        if not isinstance(cat_id, int):
-            raise RuntimeError("Failed to create WordPress category")
-        return cat_id
+    def ensure_category(self, category_name: str) -> int:
+        category_name = category_name.strip()
+        if not category_name:
+            raise ValueError("Category name is required")
+        return self._ensure_term("categories", category_name, "category")
 
     def ensure_tag(self, tag_name: str) -> int:
         tag_name = tag_name.strip()
         if not tag_name:
             raise ValueError("Tag name is required")
+        return self._ensure_term("tags", tag_name, "tag")
 
-        response = self._request_with_rest_fallback(
-            "GET",
-            "/wp/v2/tags",
-            headers=self._headers(),
-        )
-        tags = response.json()
-        if isinstance(tags, list):
-            for tag in tags:
-                if str(tag.get("name", "")).strip().lower() == tag_name.lower():
-                    tag_id = tag.get("id")
-                    if isinstance(tag_id, int):
-                        return tag_id
+    def _term_cache(self, taxonomy: str) -> TermCache:
+        key = (self.base_url, taxonomy)
+        with self._term_caches_lock:
+            cache = self._term_caches.get(key)
+            if cache is None:
+                cache = TermCache(
+                    ttl_seconds=self.settings.wordpress_term_cache_ttl_seconds,
+                    max_size=self.settings.wordpress_term_cache_max_size,
+                )
+                self._term_caches[key] = cache
+            return cache
+
+    def _ensure_term(self, taxonomy: str, name: str, label: str) -> int:
+        cache = self._term_cache(taxonomy)
+        term_id = cache.get(name)
+        if term_id is not None:
+            return term_id
+
+        if not cache.is_warm():
+            cache.warm(self._fetch_terms(taxonomy))
+            term_id = cache.get(name)
+            if term_id is not None:
+                return term_id
+        else:
+            # Warm cache miss: the term may have been created by someone else since warm-up.
+            for term in self._fetch_terms(taxonomy, search=name):
+                cache.put(str(term.get("name", "")), term.get("id"))
+            term_id = cache.get(name)
+            if term_id is not None:
+                return term_id
 
         create_response = self._request_with_rest_fallback(
             "POST",
-            "/wp/v2/tags",
+            f"/wp/v2/{taxonomy}",
             headers=self._headers(),
-            json={"name": tag_name, "slug": slugify(tag_name)},
+            json={"name": name, "slug": slugify(name)},
         )
         created = create_response.json()
-        tag_id = created.get("id")
-        if not isinstance(tag_id, int):
-            raise RuntimeError("Failed to create WordPress tag")
-        return tag_id
+        term_id = created.get("id")
+        if not isinstance(term_id, int):
+            raise RuntimeError(f"Failed to create WordPress {label}")
+        cache.put(name, term_id)
+        return term_id
+
+    def _fetch_terms(self, taxonomy: str, search: str | None = None) -> list[dict[str, Any]]:
+        terms: list[dict[str, Any]] = []
+        page = 1
+        while True:
+            params: dict[str, Any] = {"per_page": 100, "page": page, "_fields": "id,name"}
+            if search:
+                params["search"] = search
+            response = self._request_with_rest_fallback(
+                "GET",
+                f"/wp/v2/{taxonomy}",
+                headers=self._headers(),
+                params=params,
+            )
+            batch = response.json()
+            if not isinstance(batch, list):
+                break
+            terms.extend(x for x in batch if isinstance(x, dict))
+            total_pages = int(response.headers.get("X-WP-TotalPages", "1") or 1)
+            if page >= total_pages or not batch:
+                break
+            page += 1
+        return terms
+
+
+class TermCache:
+    """Normalized term name -> id map with TTL and LRU size bound."""
+
+    def __init__(self, ttl_seconds: int, max_size: int):
+        self.ttl_seconds = max(0, int(ttl_seconds))
+        self.max_size = max(1, int(max_size))
+        self._items: OrderedDict[str, tuple[int, float]] = OrderedDict()
+        self._warmed_at: float | None = None
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def normalize(name: str) -> str:
+        return html.unescape(str(name or "")).strip().lower()
+
+    def is_warm(self) -> bool:
+        with self._lock:
+            return self._warmed_at is not None and time.monotonic() - self._warmed_at < self.ttl_seconds
+
+    def warm(self, terms: list[dict[str, Any]]) -> None:
+        for term in terms:
+            self.put(str(term.get("name", "")), term.get("id"))
+        with self._lock:
+            self._warmed_at = time.monotonic()
+
+    def get(self, name: str) -> int | None:
+        key = self.normalize(name)
+        with self._lock:
+            entry = self._items.get(key)
+            if entry is None:
+                return None
+            term_id, expires_at = entry
+            if time.monotonic() >= expires_at:
+                del self._items[key]
+                return None
+            self._items.move_to_end(key)
+            return term_id
+
+    def put(self, name: str, term_id: Any) -> None:
+        key = self.normalize(name)
+        if not key or not isinstance(term_id, int):
+            return
+        with self._lock:
+            self._items[key] = (term_id, time.monotonic() + self.ttl_seconds)
+            self._items.move_to_end(key)
+            while len(self._items) > self.max_size:
+                self._items.popitem(last=False)
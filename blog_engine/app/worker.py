@@ -1,14 +1,108 @@
 from __future__ import annotations
 
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 import json
 import logging
 import random
+import signal
+import threading
 import time
+from typing import Any
 
 from app.config import get_settings
 from app.database import Base, SessionLocal, engine
 from app.main import _process_queue_posts
+from app.services.container import get_services
+from app.services.post_queue import ClaimBudget, PostQueue
+
+
+def _run_workers(limit: int, workers: int) -> dict[str, Any]:
+    budget = ClaimBudget(max(1, limit))
+
+    def _work(index: int) -> dict[str, Any]:
+        with SessionLocal() as db:
+            return _process_queue_posts(db, limit, worker_id=PostQueue.worker_id(index), budget=budget)
+
+    if workers == 1:
+        return _work(0)
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="queue-worker") as pool:
+        results = list(pool.map(_work, range(workers)))
+    merged: dict[str, Any] = {"requested": 0, "processed": 0, "failed": 0, "published": 0, "errors": []}
+    for res in results:
+        for key in ("requested", "processed", "failed", "published"):
+            merged[key] += res[key]
+        merged["errors"].extend(res["errors"])
+    merged["workers"] = workers
+    return merged
+
+
+def _random_delay_minutes() -> int:
+    settings = get_settings()
+    delay_min = max(0, settings.worker_random_delay_min_minutes)
+    delay_max = max(delay_min, settings.worker_random_delay_max_minutes)
+    if delay_max <= 0:
+        return 0
+    return random.randint(delay_min, delay_max)
+
+
+def _run_daemon(workers: int, use_random_delay: bool) -> None:
+    settings = get_settings()
+    logger = logging.getLogger("blog_engine.worker")
+    stop = threading.Event()
+
+    def _request_stop(signum: int, _frame: Any) -> None:
+        logger.info("daemon stop requested | signal=%s", signum)
+        stop.set()
+
+    signal.signal(signal.SIGINT, _request_stop)
+    signal.signal(signal.SIGTERM, _request_stop)
+
+    def _publish_delay() -> bool:
+        # Returns False when shutdown interrupts the wait; the post is then requeued, not rushed out.
+        delay_minutes = _random_delay_minutes()
+        if delay_minutes > 0:
+            logger.info("random publish delay | wait_minutes=%s", delay_minutes)
+            return not stop.wait(delay_minutes * 60)
+        return not stop.is_set()
+
+    before_generate = _publish_delay if use_random_delay else None
+    poll_min = max(0.5, settings.worker_poll_min_seconds)
+    poll_max = max(poll_min, settings.worker_poll_max_seconds)
+
+    def _loop(index: int) -> None:
+        worker_id = PostQueue.worker_id(index)
+        idle_wait = poll_min
+        with SessionLocal() as db:
+            while not stop.is_set():
+                try:
+                    result = _process_queue_posts(db, 1, worker_id=worker_id, before_generate=before_generate)
+                except Exception:
+                    logger.exception("daemon poll failed | worker=%s", worker_id)
+                    db.rollback()
+                    result = {"requested": 0}
+                if result["requested"]:
+                    idle_wait = poll_min
+                    continue
+                # Nothing to claim: back off up to poll_max, reset as soon as work shows up.
+                stop.wait(idle_wait)
+                idle_wait = min(poll_max, idle_wait * 2)
+
+    outbox = get_services().indexing_outbox
+    outbox.start()
+    logger.info("daemon started | workers=%s poll=[%s,%s]s", workers, poll_min, poll_max)
+    threads = [
+        threading.Thread(target=_loop, args=(index,), name=f"queue-daemon-{index}", daemon=True)
+        for index in range(workers)
+    ]
+    for thread in threads:
+        thread.start()
+    while any(thread.is_alive() for thread in threads):
+        for thread in threads:
+            thread.join(timeout=1)
+    outbox.stop()
+    logger.info("daemon stopped")
 
 
 def main() -> None:
@@ -19,6 +113,7 @@ def main() -> None:
     settings = get_settings()
     if settings.auto_create_tables:
         Base.metadata.create_all(bind=engine)
+    get_services()
 
     parser = argparse.ArgumentParser(description="Process queued blog-engine posts")
     parser.add_argument(
@@ -27,31 +122,44 @@ def main() -> None:
         default=settings.batch_process_limit,
         help="max number of queued posts to process in this run",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=settings.worker_concurrency,
+        help="number of concurrent workers claiming posts from the queue",
+    )
     parser.add_argument(
         "--skip-random-delay",
         action="store_true",
         help="run immediately without random wait",
     )
+    parser.add_argument(
+        "--daemon",
+        action="store_true",
+        help="keep running and poll for queued posts; random delay applies per auto-publish post before generation",
+    )
     args = parser.parse_args()
 
+    if args.daemon:
+        _run_daemon(max(1, args.workers), use_random_delay=not args.skip_random_delay)
+        return
+
     delay_seconds = 0
     if not args.skip_random_delay:
-        delay_min = max(0, settings.worker_random_delay_min_minutes)
-        delay_max = max(delay_min, settings.worker_random_delay_max_minutes)
-        if delay_max > 0:
-            delay_minutes = random.randint(delay_min, delay_max)
-            delay_seconds = delay_minutes * 60
+        delay_minutes = _random_delay_minutes()
+        delay_seconds = delay_minutes * 60
+        if delay_seconds > 0:
             logging.getLogger("blog_engine.worker").info(
                 "random start delay enabled | wait_minutes=%s range=[%s,%s]",
                 delay_minutes,
-                delay_min,
-                delay_max,
+                settings.worker_random_delay_min_minutes,
+                settings.worker_random_delay_max_minutes,
             )
-            if delay_seconds > 0:
-                time.sleep(delay_seconds)
+            time.sleep(delay_seconds)
 
-    with SessionLocal() as db:
-        result = _process_queue_posts(db, args.limit)
+    result = _run_workers(args.limit, max(1, args.workers))
+    # One-shot runs have no background drainer; flush what this run queued (within rate limits).
+    result["indexing"] = get_services().indexing_outbox.drain()
     result["delay_seconds"] = delay_seconds
     print(json.dumps(result, ensure_ascii=False, indent=2))
 
@@ -0,0 +1,72 @@
+"""Benchmark section rendering: shared markdown engine vs. the previous per-call approach.
+
+Usage (from blog_engine/):
+    python scripts/bench_markdown.py
+"""
+from __future__ import annotations
+
+from collections.abc import Callable
+import html
+from pathlib import Path
+import re
+import sys
+import timeit
+
+import markdown
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from app.services.markdown_engine import apply_style_placeholders, render_section_html  # noqa: E402
+
+SECTION = (
+    "영화 소개 문장입니다. {{B:핵심 포인트}}가 있고 {{HL:강조 문구}} 그리고 {{ACC:포인트}}! " * 6
+    + "\n\n- 항목 {{B:하나}}\n- 항목 둘\n- 항목 셋\n"
+)
+POST = [SECTION] * 8
+SHORT_POST = ["짧은 문단 {{B:하나}}."] * 8
+
+
+def baseline_placeholders(text: str) -> str:
+    # Previous implementation: three uncompiled passes, one per placeholder kind.
+    out = str(text or "")
+
+    def _wrap(template: str) -> Callable[[re.Match[str]], str]:
+        def _sub(match: re.Match[str]) -> str:
+            inner = html.escape(match.group(1).strip())
+            return template.format(inner) if inner else ""
+
+        return _sub
+
+    out = re.sub(r"\{\{B:(.*?)\}\}", _wrap("**{}**"), out, flags=re.DOTALL)
+    out = re.sub(r"\{\{HL:(.*?)\}\}", _wrap('<span class="be-hl">{}</span>'), out, flags=re.DOTALL)
+    out = re.sub(r"\{\{ACC:(.*?)\}\}", _wrap('<span class="be-acc">{}</span>'), out, flags=re.DOTALL)
+    return out
+
+
+def baseline_section_html(content: str) -> str:
+    # Previous implementation: a fresh Markdown instance (and extension setup) for every section.
+    normalized = baseline_placeholders(str(content or ""))
+    normalized = re.sub(r"([.!?])\s+(?=[A-Za-z0-9가-힣\"'(\[])", r"\1\n", normalized)
+    return markdown.markdown(normalized, extensions=["extra", "sane_lists", "nl2br"], output_format="html5")
+
+
+def best(fn: Callable[[], object], number: int) -> float:
+    return min(timeit.repeat(fn, number=number, repeat=7)) / number
+
+
+def main() -> None:
+    old = best(lambda: [baseline_section_html(x) for x in POST], 30)
+    new = best(lambda: [render_section_html(x) for x in POST], 30)
+    print(f"8-section post:   baseline {old * 1000:7.2f} ms  shared {new * 1000:7.2f} ms  ({old / new:.2f}x)")
+
+    old = best(lambda: [baseline_section_html(x) for x in SHORT_POST], 100)
+    new = best(lambda: [render_section_html(x) for x in SHORT_POST], 100)
+    print(f"8 short sections: baseline {old * 1000:7.2f} ms  shared {new * 1000:7.2f} ms  ({old / new:.2f}x)")
+
+    old = best(lambda: baseline_placeholders(SECTION), 2000)
+    new = best(lambda: apply_style_placeholders(SECTION), 2000)
+    print(f"placeholders:     baseline {old * 1e6:7.1f} us  shared {new * 1e6:7.1f} us  ({old / new:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -9,6 +9,10 @@ import requests
 
 from app.config import Settings
 
+# /generate-posts rejects more than 100 posts per request; smaller chunks also keep each request's
+# timeout (scaled by chunk size) bounded.
+GENERATE_POSTS_CHUNK_SIZE = 20
+
 
 class BEngineClient:
     def __init__(self, settings: Settings):
@@ -23,6 +27,16 @@ class BEngineClient:
             return self._submit_via_api(payload)
         raise RuntimeError(f"Unsupported B_ENGINE_SUBMIT_MODE: {self.settings.b_engine_submit_mode}")
 
+    def generate_posts(self, payloads: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        if not payloads:
+            return []
+        submit_mode = (self.settings.b_engine_submit_mode or "api").strip().lower()
+        if submit_mode == "db_queue":
+            return self._enqueue_many_to_b_engine_db(payloads)
+        if submit_mode == "api":
+            return self._submit_many_via_api(payloads)
+        raise RuntimeError(f"Unsupported B_ENGINE_SUBMIT_MODE: {self.settings.b_engine_submit_mode}")
+
     def get_post_status(self, post_id: int) -> dict[str, Any]:
         submit_mode = (self.settings.b_engine_submit_mode or "api").strip().lower()
         if submit_mode == "db_queue":
@@ -48,26 +62,71 @@ class BEngineClient:
             )
         return response.json()
 
-    def _enqueue_to_b_engine_db(self, payload: dict[str, Any]) -> dict[str, Any]:
+    def _submit_many_via_api(self, payloads: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        results: list[dict[str, Any]] = []
+        for start in range(0, len(payloads), GENERATE_POSTS_CHUNK_SIZE):
+            chunk = payloads[start : start + GENERATE_POSTS_CHUNK_SIZE]
+            try:
+                results.extend(self._submit_chunk_via_api(chunk))
+            except Exception as exc:
+                # Earlier chunks already created posts; report this chunk per post instead of losing them.
+                results.extend({"post_id": None, "status": "failed", "error": str(exc)} for _ in chunk)
+        return results
+
+    def _submit_chunk_via_api(self, payloads: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        headers = {"Content-Type": "application/json"}
+        if self.settings.b_engine_admin_token:
+            headers["x-admin-token"] = self.settings.b_engine_admin_token
+
+        response = requests.post(
+            f"{self.base_url}/generate-posts",
+            json={"posts": payloads},
+            headers=headers,
+            timeout=max(60, 60 * len(payloads)),
+        )
+        if response.status_code >= 400:
+            raise RuntimeError(
+                f"B-engine generate-posts failed: status={response.status_code}, body={response.text[:1000]}"
+            )
+        return list(response.json().get("posts", []))
+
+    def _enqueue_many_to_b_engine_db(self, payloads: list[dict[str, Any]]) -> list[dict[str, Any]]:
         connection = self._db_connect()
         try:
             now = datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S")
-            raw_json = json.dumps(payload, ensure_ascii=False)
+            results: list[dict[str, Any]] = []
+            # Single transaction: one commit for the whole burst, and a worker never sees a
+            # queued post whose post_payloads row is not there yet.
+            connection.begin()
             with connection.cursor() as cursor:
-                cursor.execute(
-                    """
-                    INSERT INTO posts (raw_input, status, created_at)
-                    VALUES (%s, %s, %s)
-                    """,
-                    (raw_json, "queued", now),
-                )
-                post_id = int(cursor.lastrowid or 0)
-            return {"post_id": post_id, "status": "queued"}
+                for payload in payloads:
+                    cursor.execute(
+                        """
+                        INSERT INTO posts (status, attempt_count, created_at)
+                        VALUES (%s, %s, %s)
+                        """,
+                        ("queued", 0, now),
+                    )
+                    post_id = int(cursor.lastrowid or 0)
+                    cursor.execute(
+                        """
+                        INSERT INTO post_payloads (post_id, raw_input)
+                        VALUES (%s, %s)
+                        """,
+                        (post_id, json.dumps(payload, ensure_ascii=False)),
+                    )
+                    results.append({"post_id": post_id, "status": "queued"})
+            connection.commit()
+            return results
         except Exception as exc:
+            connection.rollback()
             raise RuntimeError(f"B-engine DB enqueue failed: {exc}") from exc
         finally:
             connection.close()
 
+    def _enqueue_to_b_engine_db(self, payload: dict[str, Any]) -> dict[str, Any]:
+        return self._enqueue_many_to_b_engine_db([payload])[0]
+
     def _get_post_status_via_api(self, post_id: int) -> dict[str, Any]:
         headers: dict[str, str] = {}
         if self.settings.b_engine_admin_token:
@@ -94,7 +153,7 @@ class BEngineClient:
             with connection.cursor() as cursor:
                 cursor.execute(
                     """
-                    SELECT id, status, raw_input
+                    SELECT id, status, last_error
                     FROM posts
                     WHERE id=%s
                     """,
@@ -103,18 +162,10 @@ class BEngineClient:
                 row = cursor.fetchone()
             if not row:
                 raise RuntimeError(f"B-engine post not found: post_id={post_id}")
-            raw_input = row.get("raw_input")
-            if isinstance(raw_input, str):
-                try:
-                    raw_input = json.loads(raw_input)
-                except Exception:
-                    raw_input = {}
-            if not isinstance(raw_input, dict):
-                raw_input = {}
             return {
                 "post_id": int(row.get("id", post_id) or post_id),
                 "status": str(row.get("status", "") or "").strip().lower(),
-                "last_error": str(raw_input.get("last_error", "") or "").strip(),
+                "last_error": str(row.get("last_error", "") or "").strip(),
             }
         except Exception as exc:
             raise RuntimeError(f"B-engine DB status failed: {exc}") from exc
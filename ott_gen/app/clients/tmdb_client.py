@@ -1,23 +1,126 @@
 from __future__ import annotations
 
+import threading
+import time
 from typing import Any
 
 import requests
+from requests.adapters import HTTPAdapter
 
+from app.clients.tmdb_cache import TMDBResponseCache
 from app.config import Settings
 
+BUNDLE_APPEND = "credits,images,watch/providers"
+IMAGE_LANGUAGES = "ko,en,null"
+RETRY_STATUS = 429
+MAX_RATE_LIMIT_RETRIES = 3
+
+
+class RateLimiter:
+    """Blocking token bucket shared by every thread that calls TMDB."""
+
+    def __init__(self, per_second: float):
+        self.rate = max(0.1, float(per_second))
+        self.capacity = max(1.0, self.rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1.0:
+                    self._tokens -= 1.0
+                    return
+                wait = (1.0 - self._tokens) / self.rate
+            time.sleep(wait)
+
 
 class TMDBClient:
     def __init__(self, settings: Settings):
         self.settings = settings
         self.base_url = "https://api.themoviedb.org/3"
+        self.concurrency = max(1, int(settings.tmdb_fetch_concurrency))
         self.session = requests.Session()
         self.session.params = {"api_key": settings.tmdb_api_key, "language": settings.tmdb_language}
+        # Sized for the parse fetch pool so concurrent calls reuse keep-alive connections.
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.concurrency)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.rate_limiter = RateLimiter(settings.tmdb_requests_per_second)
+        self.cache: TMDBResponseCache | None = None
+        if settings.tmdb_cache_enabled:
+            self.cache = TMDBResponseCache(settings.tmdb_cache_path)
 
     def _get(self, path: str, **params: Any) -> dict[str, Any]:
-        response = self.session.get(f"{self.base_url}{path}", params=params, timeout=20)
+        cached = None
+        cache_key = ""
+        headers: dict[str, str] = {}
+        if self.cache is not None:
+            # language comes from the session params but changes the response, so it is part of the key.
+            cache_key = TMDBResponseCache.make_key(path, {**params, "language": self.settings.tmdb_language})
+            cached = self.cache.lookup(cache_key)
+            if cached is not None and cached.fresh:
+                self.cache.record("hits")
+                return cached.body
+            if cached is not None and cached.etag:
+                headers["If-None-Match"] = cached.etag
+            if cached is not None and cached.last_modified:
+                headers["If-Modified-Since"] = cached.last_modified
+
+        for attempt in range(MAX_RATE_LIMIT_RETRIES + 1):
+            self.rate_limiter.acquire()
+            response = self.session.get(f"{self.base_url}{path}", params=params, headers=headers, timeout=20)
+            if response.status_code != RETRY_STATUS or attempt == MAX_RATE_LIMIT_RETRIES:
+                break
+            time.sleep(self._retry_after(response, attempt))
+
+        if self.cache is None:
+            response.raise_for_status()
+            return response.json()
+        ttl = self._cache_ttl_seconds(path, params)
+        if response.status_code == 304 and cached is not None:
+            self.cache.refresh(cache_key, ttl)
+            self.cache.record("revalidated")
+            return cached.body
         response.raise_for_status()
-        return response.json()
+        data = response.json()
+        self.cache.store(
+            cache_key,
+            path,
+            data,
+            response.headers.get("ETag", ""),
+            response.headers.get("Last-Modified", ""),
+            ttl,
+        )
+        self.cache.record("misses")
+        return data
+
+    def _cache_ttl_seconds(self, path: str, params: dict[str, Any]) -> float:
+        # Availability changes often; titles, credits and artwork rarely do.
+        if "watch/providers" in path or "watch/providers" in str(params.get("append_to_response", "")):
+            hours = self.settings.tmdb_cache_ttl_providers_hours
+        elif path.startswith(("/discover/", "/trending/")):
+            hours = self.settings.tmdb_cache_ttl_lists_hours
+        else:
+            hours = self.settings.tmdb_cache_ttl_details_hours
+        return max(0.0, float(hours)) * 3600
+
+    def cache_stats(self, reset: bool = False) -> dict[str, int]:
+        if self.cache is None:
+            return {}
+        return self.cache.stats(reset=reset)
+
+    @staticmethod
+    def _retry_after(response: requests.Response, attempt: int) -> float:
+        raw = str(response.headers.get("Retry-After", "") or "").strip()
+        try:
+            return min(30.0, max(0.5, float(raw)))
+        except ValueError:
+            return float(2**attempt)
 
     def fetch_discover_page(
         self,
@@ -46,11 +149,11 @@ class TMDBClient:
     def latest_sort_by_for(media_type: str) -> str:
         return "release_date.desc" if media_type == "movie" else "first_air_date.desc"
 
-    def fetch_details(self, media_type: str, tmdb_id: int) -> dict[str, Any]:
-        return self._get(f"/{media_type}/{tmdb_id}", append_to_response="credits")
-
-    def fetch_watch_providers(self, media_type: str, tmdb_id: int) -> dict[str, Any]:
-        return self._get(f"/{media_type}/{tmdb_id}/watch/providers")
-
-    def fetch_images(self, media_type: str, tmdb_id: int) -> dict[str, Any]:
-        return self._get(f"/{media_type}/{tmdb_id}/images", include_image_language="ko,en,null")
+    def fetch_bundle(self, media_type: str, tmdb_id: int) -> dict[str, Any]:
+        # Details plus credits, images and watch providers in one round-trip; the appended
+        # parts come back under the "credits", "images" and "watch/providers" keys.
+        return self._get(
+            f"/{media_type}/{tmdb_id}",
+            append_to_response=BUNDLE_APPEND,
+            include_image_language=IMAGE_LANGUAGES,
+        )
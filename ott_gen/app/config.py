@@ -16,6 +16,8 @@ class Settings(BaseSettings):
     tmdb_language: str = Field(default="ko-KR", alias="TMDB_LANGUAGE")
     tmdb_region: str = Field(default="KR", alias="TMDB_REGION")
     tmdb_image_base_url: str = Field(default="https://image.tmdb.org/t/p/original", alias="TMDB_IMAGE_BASE_URL")
+    tmdb_fetch_concurrency: int = Field(default=8, alias="TMDB_FETCH_CONCURRENCY")
+    tmdb_requests_per_second: float = Field(default=20.0, alias="TMDB_REQUESTS_PER_SECOND")
     target_providers: str = Field(default="Netflix,Disney Plus", alias="TARGET_PROVIDERS")
     run_mode: str = Field(default="hybrid", alias="RUN_MODE")
     candidate_pages: int = Field(default=2, alias="CANDIDATE_PAGES")
@@ -86,6 +88,11 @@ class Settings(BaseSettings):
     )
 
     sqlite_path: Path = Field(default=Path("./data/ott_gen.db"), alias="SQLITE_PATH")
+    tmdb_cache_enabled: bool = Field(default=True, alias="TMDB_CACHE_ENABLED")
+    tmdb_cache_path: Path = Field(default=Path("./data/tmdb_cache.db"), alias="TMDB_CACHE_PATH")
+    tmdb_cache_ttl_providers_hours: float = Field(default=12, alias="TMDB_CACHE_TTL_PROVIDERS_HOURS")
+    tmdb_cache_ttl_details_hours: float = Field(default=168, alias="TMDB_CACHE_TTL_DETAILS_HOURS")
+    tmdb_cache_ttl_lists_hours: float = Field(default=6, alias="TMDB_CACHE_TTL_LISTS_HOURS")
     web_host: str = Field(default="0.0.0.0", alias="WEB_HOST")
     web_port: int = Field(default=8010, alias="WEB_PORT")
 
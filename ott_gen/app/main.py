@@ -25,13 +25,19 @@ def main() -> None:
 
     settings = get_settings()
     engine = OTTGenEngine(settings)
+    try:
+        _run_action(engine, args.action)
+    finally:
+        engine.store.close()
 
-    if args.action == "parse":
+
+def _run_action(engine: OTTGenEngine, action: str) -> None:
+    if action == "parse":
         parse_result = engine.parse_sources()
         print({"action": "parse", "parse": parse_result})
         return
 
-    if args.action == "full":
+    if action == "full":
         parse_result = engine.parse_sources()
         generate_result = engine.generate_daily_batch()
         print({"action": "full", "parse": parse_result, "generate": generate_result})
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 import logging
 from datetime import datetime
 import re
@@ -69,69 +70,42 @@ class OTTGenEngine:
         self.logger = logging.getLogger("ott_gen.engine")
 
     def parse_sources(self) -> dict[str, int]:
+        self.tmdb.cache_stats(reset=True)
         candidates, parse_meta = self._collect_parse_candidates()
         self.logger.info("parse started | count=%s meta=%s", len(candidates), parse_meta)
 
         queued = 0
         skipped_provider = 0
         skipped_images = 0
+        skipped_error = 0
         skipped_dup = 0
 
+        unique: list[dict] = []
         seen_keys: set[tuple[int, str]] = set()
         for item in candidates:
-            tmdb_id = int(item["id"])
-            media_type = item.get("_media_type", "movie")
-            source = item.get("_source", "unknown")
-            dedup_key = (tmdb_id, media_type)
+            dedup_key = (int(item["id"]), item.get("_media_type", "movie"))
             if dedup_key in seen_keys:
                 skipped_dup += 1
                 continue
             seen_keys.add(dedup_key)
+            unique.append(item)
+
+        # TMDB lookups are I/O bound; fan them out while the client's token bucket keeps us under the API limit.
+        prepared: list[dict] = []
+        workers = min(self.tmdb.concurrency, max(1, len(unique)))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="tmdb-fetch") as pool:
+            for outcome, row in pool.map(self._prepare_candidate, unique):
+                if outcome == "no_provider":
+                    skipped_provider += 1
+                elif outcome == "few_images":
+                    skipped_images += 1
+                elif outcome == "error":
+                    skipped_error += 1
+                else:
+                    prepared.append(row)
 
-            providers = self._provider_names(media_type, tmdb_id)
-            if not providers:
-                skipped_provider += 1
-                continue
-
-            details = self.tmdb.fetch_details(media_type, tmdb_id)
-            payload_images, poster_url, still_urls = self._build_images(media_type, tmdb_id, details)
-            if len(still_urls) < self.settings.min_stills:
-                skipped_images += 1
-                continue
-
-            pv = build_prompt_variables(details)
-            original_overview = (pv.get("overview") or "").strip()
-            enriched_overview = ""
-            pv["overview"] = original_overview
-            providers_ko = [self._provider_to_korean(x) for x in providers]
-            providers_ko = [x for x in providers_ko if x]
-            primary_provider_ko = providers_ko[0] if providers_ko else ""
-            extra_meta = {
-                "release_date": str(pv.get("release_date", "") or ""),
-                "runtime": str(pv.get("runtime", "") or ""),
-                "director": str(pv.get("director", "") or ""),
-                "cast": str(pv.get("cast", "") or ""),
-                "providers_ko": ", ".join(providers_ko),
-                "primary_provider_ko": primary_provider_ko,
-            }
-
-            changed = self.store.upsert_candidate(
-                tmdb_id=tmdb_id,
-                media_type=media_type,
-                source=source,
-                title=pv["title"],
-                overview=pv["overview"],
-                original_overview=original_overview,
-                enriched_overview=enriched_overview,
-                rating=pv["rating"],
-                genres=pv["genres"],
-                year=pv["year"],
-                provider_names=", ".join(providers),
-                extra_meta=extra_meta,
-                poster_url=poster_url,
-                still_urls=still_urls,
-                dedup_days=self.settings.dedup_days,
-            )
+        # One transaction (one fsync) for the whole parse instead of one per candidate.
+        for changed in self.store.upsert_candidates(prepared):
             if changed:
                 queued += 1
             else:
@@ -141,14 +115,67 @@ class OTTGenEngine:
             "queued": queued,
             "skipped_provider": skipped_provider,
             "skipped_images": skipped_images,
+            "skipped_error": skipped_error,
             "skipped_duplicate": skipped_dup,
             "latest_included": int(parse_meta.get("latest_included", 0)),
             "latest_pages": int(parse_meta.get("latest_pages", 0)),
             "backfill_pages": int(parse_meta.get("backfill_pages", 0)),
         }
-        self.logger.info("parse finished | %s", result)
+        self.logger.info("parse finished | %s tmdb_cache=%s", result, self.tmdb.cache_stats(reset=True))
         return result
 
+    def _prepare_candidate(self, item: dict) -> tuple[str, dict]:
+        tmdb_id = int(item["id"])
+        media_type = item.get("_media_type", "movie")
+        source = item.get("_source", "unknown")
+
+        # One bundled request per candidate: details + credits + images + watch providers.
+        # A failed lookup only skips this candidate; the rest of the parse is still upserted.
+        try:
+            details = self.tmdb.fetch_bundle(media_type, tmdb_id)
+        except Exception as exc:
+            self.logger.warning("parse lookup failed | tmdb_id=%s media_type=%s error=%s", tmdb_id, media_type, exc)
+            return "error", {}
+        providers = self._provider_names(details)
+        if not providers:
+            return "no_provider", {}
+
+        payload_images, poster_url, still_urls = self._build_images(details)
+        if len(still_urls) < self.settings.min_stills:
+            return "few_images", {}
+
+        pv = build_prompt_variables(details)
+        original_overview = (pv.get("overview") or "").strip()
+        enriched_overview = ""
+        pv["overview"] = original_overview
+        providers_ko = [self._provider_to_korean(x) for x in providers]
+        providers_ko = [x for x in providers_ko if x]
+        primary_provider_ko = providers_ko[0] if providers_ko else ""
+        extra_meta = {
+            "release_date": str(pv.get("release_date", "") or ""),
+            "runtime": str(pv.get("runtime", "") or ""),
+            "director": str(pv.get("director", "") or ""),
+            "cast": str(pv.get("cast", "") or ""),
+            "providers_ko": ", ".join(providers_ko),
+            "primary_provider_ko": primary_provider_ko,
+        }
+        return "ok", {
+            "tmdb_id": tmdb_id,
+            "media_type": media_type,
+            "source": source,
+            "title": pv["title"],
+            "overview": pv["overview"],
+            "original_overview": original_overview,
+            "enriched_overview": enriched_overview,
+            "rating": pv["rating"],
+            "genres": pv["genres"],
+            "year": pv["year"],
+            "provider_names": ", ".join(providers),
+            "extra_meta": extra_meta,
+            "poster_url": poster_url,
+            "still_urls": still_urls,
+        }
+
     def _collect_parse_candidates(self) -> tuple[list[dict], dict[str, int]]:
         media_types = ["movie", "tv"]
         candidates: list[dict] = []
@@ -211,6 +238,7 @@ class OTTGenEngine:
         generated = 0
         failed = 0
 
+        prepared: list[tuple[CandidateItem, dict]] = []
         for item in queued:
             try:
                 if not self.store.acquire_generation_lock(item.id):
@@ -219,9 +247,33 @@ class OTTGenEngine:
                 item = self.store.get_candidate(item.id) or item
                 if self.settings.scheduler_enrich_overview:
                     item = self._enrich_for_manual_generate(item, force=True)
-                payload = self._candidate_to_payload(item)
-                res = self.b_engine.generate_post(payload)
+                prepared.append((item, self._candidate_to_payload(item)))
+            except Exception as exc:
+                failed += 1
+                self.store.mark_failed(item.id, str(exc))
+                self.logger.error("generate failed | candidate_id=%s error=%s", item.id, exc)
+
+        if prepared:
+            # One round-trip (or one DB transaction) for the whole run instead of one per candidate.
+            try:
+                results = self.b_engine.generate_posts([payload for _, payload in prepared])
+            except Exception as exc:
+                results = []
+                for item, _ in prepared:
+                    failed += 1
+                    self.store.mark_failed(item.id, str(exc))
+                    self.logger.error("generate failed | candidate_id=%s error=%s", item.id, exc)
+
+            for (item, _), res in zip(prepared, results):
                 returned_status = str(res.get("status", "") or "").strip().lower()
+                if returned_status == "failed":
+                    failed += 1
+                    error = res.get("error") or f"B-engine generation failed: post_id={res.get('post_id')}"
+                    self.store.mark_failed(item.id, error)
+                    self.logger.error(
+                        "generate failed | candidate_id=%s b_post_id=%s error=%s", item.id, res.get("post_id"), error
+                    )
+                    continue
                 if returned_status in {"queued", "draft", "processing"}:
                     self.store.mark_submitted(item.id, int(res.get("post_id", 0) or 0))
                 else:
@@ -235,10 +287,6 @@ class OTTGenEngine:
                     res.get("post_id"),
                     returned_status or "-",
                 )
-            except Exception as exc:
-                failed += 1
-                self.store.mark_failed(item.id, str(exc))
-                self.logger.error("generate failed | candidate_id=%s error=%s", item.id, exc)
 
         used_after = self.store.today_generated_count()
         return {
@@ -419,8 +467,8 @@ class OTTGenEngine:
         updated = self.store.get_candidate(item.id)
         return updated or item
 
-    def _provider_names(self, media_type: str, tmdb_id: int) -> list[str]:
-        data = self.tmdb.fetch_watch_providers(media_type, tmdb_id)
+    def _provider_names(self, details: dict) -> list[str]:
+        data = details.get("watch/providers") or {}
         kr = (data.get("results") or {}).get(self.settings.tmdb_region, {})
         providers = kr.get("flatrate") or []
         names = [str(p.get("provider_name", "")).strip() for p in providers if p.get("provider_name")]
@@ -429,7 +477,7 @@ class OTTGenEngine:
             return []
         return names
 
-    def _build_images(self, media_type: str, tmdb_id: int, details: dict) -> tuple[list[dict], str, list[str]]:
+    def _build_images(self, details: dict) -> tuple[list[dict], str, list[str]]:
         base = self.settings.tmdb_image_base_url.rstrip("/")
         images: list[dict] = []
         poster_url = ""
@@ -443,7 +491,7 @@ class OTTGenEngine:
                 images.append({"url": poster_url, "type": "poster"})
                 seen.add(poster_url)
 
-        image_data = self.tmdb.fetch_images(media_type, tmdb_id)
+        image_data = details.get("images") or {}
         for b in image_data.get("backdrops", []):
             fp = b.get("file_path")
             if not fp:
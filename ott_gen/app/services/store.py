@@ -1,11 +1,43 @@
 from __future__ import annotations
 
 import json
+import os
 import sqlite3
+import threading
+import weakref
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 
+# Per-connection tuning; WAL lets the dashboard read while the scheduler/CLI writes.
+SQLITE_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA cache_size=-16384",  # 16 MiB page cache
+    "PRAGMA mmap_size=134217728",  # 128 MiB
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA foreign_keys=ON",
+)
+SQLITE_BUSY_TIMEOUT_SECONDS = 30.0
+SQLITE_IN_CHUNK = 500
+
+# Candidates in these states are owned by the generation pipeline; re-parsing never overwrites them.
+PROTECTED_STATUSES = ("generated", "generating", "submitted")
+
+
+class _ThreadConnection:
+    """Owns one thread's sqlite connection and closes it when the thread's local storage is dropped."""
+
+    def __init__(self, conn: sqlite3.Connection):
+        self.conn = conn
+        self.pid = os.getpid()
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def __del__(self) -> None:
+        # Short-lived threads (anyio's threadpool recycles idle workers) release their connection on exit.
+        self.conn.close()
+
 
 @dataclass
 class CandidateItem:
@@ -34,13 +66,40 @@ class Store:
     def __init__(self, db_path: Path):
         self.db_path = db_path
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._local = threading.local()
+        # Weak so an exited thread's connection is not kept alive here; close() still reaches the live ones.
+        self._all_conns: weakref.WeakSet[_ThreadConnection] = weakref.WeakSet()
+        self._all_conns_lock = threading.Lock()
         self._init_db()
 
     def _conn(self) -> sqlite3.Connection:
-        conn = sqlite3.connect(self.db_path)
+        # One long-lived connection per thread (scheduler, CLI, FastAPI threadpool workers).
+        # `with self._conn() as conn:` still commits/rolls back per call; it just no longer closes.
+        holder = getattr(self._local, "holder", None)
+        if holder is not None and holder.pid == os.getpid():
+            return holder.conn
+        # check_same_thread=False only so close() can release every thread's connection at shutdown.
+        conn = sqlite3.connect(self.db_path, timeout=SQLITE_BUSY_TIMEOUT_SECONDS, check_same_thread=False)
         conn.row_factory = sqlite3.Row
+        conn.execute(f"PRAGMA busy_timeout={int(SQLITE_BUSY_TIMEOUT_SECONDS * 1000)}")
+        # journal_mode is persistent in the file, but setting it per connection is cheap and idempotent.
+        conn.execute("PRAGMA journal_mode=WAL")
+        for pragma in SQLITE_PRAGMAS:
+            conn.execute(pragma)
+        holder = _ThreadConnection(conn)
+        self._local.holder = holder
+        with self._all_conns_lock:
+            self._all_conns.add(holder)
         return conn
 
+    def close(self) -> None:
+        with self._all_conns_lock:
+            holders = list(self._all_conns)
+            self._all_conns.clear()
+        for holder in holders:
+            holder.close()
+        self._local = threading.local()
+
     def _init_db(self) -> None:
         with self._conn() as conn:
             conn.execute(
@@ -102,90 +161,73 @@ class Store:
     def _now(self) -> str:
         return datetime.utcnow().isoformat()
 
-    def upsert_candidate(
-        self,
-        *,
-        tmdb_id: int,
-        media_type: str,
-        source: str,
-        title: str,
-        overview: str,
-        original_overview: str,
-        enriched_overview: str,
-        rating: str,
-        genres: str,
-        year: str,
-        provider_names: str,
-        extra_meta: dict,
-        poster_url: str,
-        still_urls: list[str],
-        dedup_days: int,
-    ) -> bool:
+    def upsert_candidates(self, items: list[dict]) -> list[bool]:
+        """Insert or refresh many candidates in one transaction.
+
+        Each item carries tmdb_id, media_type, source, title, overview, original_overview,
+        enriched_overview, rating, genres, year, provider_names, extra_meta, poster_url and
+        still_urls. Returns one flag per item:
+        False when the existing row is already generated/generating/submitted and was left untouched.
+        """
+        if not items:
+            return []
         now = self._now()
-        still_json = json.dumps(still_urls, ensure_ascii=False)
+        rows = [
+            (
+                int(item["tmdb_id"]),
+                str(item["media_type"]),
+                item["source"],
+                item["title"],
+                item["overview"],
+                item["original_overview"],
+                item["enriched_overview"],
+                item["rating"],
+                item["genres"],
+                item["year"],
+                item["provider_names"],
+                json.dumps(item.get("extra_meta") or {}, ensure_ascii=False),
+                item["poster_url"],
+                json.dumps(item.get("still_urls") or [], ensure_ascii=False),
+                now,
+                now,
+            )
+            for item in items
+        ]
+        protected = tuple(PROTECTED_STATUSES)
+        status_marks = ", ".join("?" for _ in protected)
         with self._conn() as conn:
-            row = conn.execute(
-                "SELECT id, status, generated_at FROM candidates WHERE tmdb_id=? AND media_type=?",
-                (tmdb_id, media_type),
-            ).fetchone()
-            if row:
-                current_status = str(row["status"] or "")
-                if current_status in {"generated", "generating", "submitted"}:
-                    return False
-                conn.execute(
-                    """
-                    UPDATE candidates
-                    SET source=?, title=?, overview=?, original_overview=?, enriched_overview=?, rating=?, genres=?, year=?,
-                        provider_names=?, extra_meta=?, poster_url=?, still_urls=?,
-                        status='queued', error_message=NULL, updated_at=?
-                    WHERE id=?
-                    """,
-                    (
-                        source,
-                        title,
-                        overview,
-                        original_overview,
-                        enriched_overview,
-                        rating,
-                        genres,
-                        year,
-                        provider_names,
-                        json.dumps(extra_meta or {}, ensure_ascii=False),
-                        poster_url,
-                        still_json,
-                        now,
-                        row["id"],
-                    ),
+            # IMMEDIATE takes the write lock up front, so the protected-row lookup and the upsert see the same state.
+            conn.execute("BEGIN IMMEDIATE")
+            blocked: set[tuple[int, str]] = set()
+            tmdb_ids = sorted({row[0] for row in rows})
+            for start in range(0, len(tmdb_ids), SQLITE_IN_CHUNK):
+                chunk = tmdb_ids[start : start + SQLITE_IN_CHUNK]
+                id_marks = ", ".join("?" for _ in chunk)
+                blocked.update(
+                    (int(r["tmdb_id"]), str(r["media_type"]))
+                    for r in conn.execute(
+                        f"SELECT tmdb_id, media_type FROM candidates WHERE tmdb_id IN ({id_marks}) AND status IN ({status_marks})",
+                        (*chunk, *protected),
+                    )
                 )
-                return True
-
-            conn.execute(
-                """
+            conn.executemany(
+                f"""
                 INSERT INTO candidates (
                     tmdb_id, media_type, source, title, overview, original_overview, enriched_overview, rating, genres, year,
                     provider_names, extra_meta, poster_url, still_urls, status, created_at, updated_at
                 ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, 'queued', ?, ?)
+                ON CONFLICT(tmdb_id, media_type) DO UPDATE SET
+                    source=excluded.source, title=excluded.title, overview=excluded.overview,
+                    original_overview=excluded.original_overview, enriched_overview=excluded.enriched_overview,
+                    rating=excluded.rating, genres=excluded.genres, year=excluded.year,
+                    provider_names=excluded.provider_names, extra_meta=excluded.extra_meta,
+                    poster_url=excluded.poster_url, still_urls=excluded.still_urls,
+                    status='queued', error_message=NULL, updated_at=excluded.updated_at
+                WHERE candidates.status NOT IN ({", ".join(f"'{status}'" for status in protected)})
                 """,
-                (
-                    tmdb_id,
-                    media_type,
-                    source,
-                    title,
-                    overview,
-                    original_overview,
-                    enriched_overview,
-                    rating,
-                    genres,
-                    year,
-                    provider_names,
-                    json.dumps(extra_meta or {}, ensure_ascii=False),
-                    poster_url,
-                    still_json,
-                    now,
-                    now,
-                ),
+                rows,
             )
-            return True
+        return [(row[0], row[1]) not in blocked for row in rows]
 
     def count_candidates(self, status: str = "queued", min_overview_length: int = 0) -> int:
         with self._conn() as conn:
@@ -16,6 +16,11 @@ engine = OTTGenEngine(settings)
 app = FastAPI(title="OTT Gen Dashboard")
 
 
+@app.on_event("shutdown")
+def _close_store() -> None:
+    engine.store.close()
+
+
 def _candidate_card(c: Any) -> str:
     status = (getattr(c, "status", "") or "").strip().lower()
     status_bg = {